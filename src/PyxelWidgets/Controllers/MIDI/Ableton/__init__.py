@@ -2,6 +2,7 @@ __all__ = []
 
 import PyxelWidgets.Controllers.MIDI
 import PyxelWidgets.Utils.Enums
+import PyxelWidgets.Utils.Palette
 import PyxelWidgets.Utils.Pixel
 import PyxelWidgets.Utils.Rectangle
 import enum
@@ -169,6 +170,8 @@ class Push2(PyxelWidgets.Controllers.MIDI.MIDI):
             (26, 26, 26), (0, 0, 255), (0, 255, 0), (255, 0, 0)
         ])
 
+    quantizer = PyxelWidgets.Utils.Palette.Palette(palette)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._header = [0x00, 0x21, 0x1D, 0x01, 0x01]
@@ -189,7 +192,12 @@ class Push2(PyxelWidgets.Controllers.MIDI.MIDI):
     
     def sendPixel(self, x: int, y: int, pixel: PyxelWidgets.Utils.Pixel.Pixel):
         index = x + (y * 8) + 36
-        self.sendNoteOn(index, pixel.findInPalette(Push2.palette))
+        self.sendNoteOn(index, Push2.quantizer.find(pixel))
+
+    def sendPixels(self, indices: tuple, pixels: PyxelWidgets.Utils.Pixel.PixelBuffer):
+        x, y = indices
+        for index, color in zip((x + (y * 8) + 36).tolist(), Push2.quantizer.quantize(pixels).tolist()):
+            self.sendNoteOn(index, color)
     
     def processMIDI(self, message, _):
         midi, delta = message
@@ -1,5 +1,6 @@
 import PyxelWidgets.Controllers.MIDI
 import PyxelWidgets.Utils.Enums
+import PyxelWidgets.Utils.Palette
 import PyxelWidgets.Utils.Pixel
 import PyxelWidgets.Utils.Rectangle
 import numpy
@@ -153,6 +154,8 @@ class MK2(PyxelWidgets.Controllers.MIDI.MIDI):
         (185, 176, 0), (63, 49, 0), (179, 95, 0), (75, 21, 2)
     ])
 
+    quantizer = PyxelWidgets.Utils.Palette.Palette(palette)
+
     def __init__(self, **kwargs):
         kwargs['width'] = kwargs.get('width', 8)
         kwargs['height'] = kwargs.get('height', 5)
@@ -172,7 +175,12 @@ class MK2(PyxelWidgets.Controllers.MIDI.MIDI):
 
     def sendPixel(self, x: int, y: int, pixel: PyxelWidgets.Utils.Pixel.Pixel):
         index = x + (y * 8)
-        self.sendNoteOn(index, pixel.findInPalette(MK2.palette))
+        self.sendNoteOn(index, MK2.quantizer.find(pixel))
+
+    def sendPixels(self, indices: tuple, pixels: PyxelWidgets.Utils.Pixel.PixelBuffer):
+        x, y = indices
+        for index, color in zip((x + (y * 8)).tolist(), MK2.quantizer.quantize(pixels).tolist()):
+            self.sendNoteOn(index, color)
     
     def processMIDI(self, message, _):
         midi, delta = message
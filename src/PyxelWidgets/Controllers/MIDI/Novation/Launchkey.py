@@ -1,5 +1,6 @@
 import PyxelWidgets.Controllers.MIDI
 import PyxelWidgets.Utils.Enums
+import PyxelWidgets.Utils.Palette
 import PyxelWidgets.Utils.Pixel
 import PyxelWidgets.Utils.Rectangle
 import enum
@@ -151,6 +152,8 @@ class MK2(PyxelWidgets.Controllers.MIDI.MIDI):
                            (143, 103, 255), (63, 63, 63), (115, 115, 115), (223, 255, 255), 
                            (159, 0, 0), (55, 0, 0), (27, 207, 0), (7, 67, 0), 
                            (183, 175, 0), (63, 51, 0), (179, 95, 0), (75, 23, 0)])
+
+    quantizer = PyxelWidgets.Utils.Palette.Palette(palette)
     
     def __init__(self, **kwargs):
         kwargs['width'] = kwargs.get('width', 8)
@@ -174,7 +177,14 @@ class MK2(PyxelWidgets.Controllers.MIDI.MIDI):
             index = 0x60 + x
         else:
             return
-        self.sendNoteOn(index, pixel.findInPalette(self.palette))
+        self.sendNoteOn(index, self.quantizer.find(pixel))
+
+    def sendPixels(self, indices: tuple, pixels: PyxelWidgets.Utils.Pixel.PixelBuffer):
+        x, y = indices
+        pads = y < 2
+        indexes = numpy.where(y[pads] == 0, 0x70, 0x60) + x[pads]
+        for index, color in zip(indexes.tolist(), self.quantizer.quantize(pixels.data[pads]).tolist()):
+            self.sendNoteOn(index, color)
 
     def connect(self, inPort: str = None, outPort: str = None):
         super().connect(inPort=inPort, outPort=outPort)
@@ -242,6 +252,8 @@ class MK3(PyxelWidgets.Controllers.MIDI.MIDI):
                            (143, 103, 255), (63, 63, 63), (115, 115, 115), (223, 255, 255), 
                            (159, 0, 0), (55, 0, 0), (27, 207, 0), (7, 67, 0), 
                            (183, 175, 0), (63, 51, 0), (179, 95, 0), (75, 23, 0)])
+
+    quantizer = PyxelWidgets.Utils.Palette.Palette(palette)
     
     def __init__(self, **kwargs):
         kwargs['width'] = kwargs.get('width', 8)
@@ -262,7 +274,14 @@ class MK3(PyxelWidgets.Controllers.MIDI.MIDI):
             index = 0x60 + x
         else:
             return
-        self.sendNoteOn(index, pixel.findInPalette(self.palette))
+        self.sendNoteOn(index, self.quantizer.find(pixel))
+
+    def sendPixels(self, indices: tuple, pixels: PyxelWidgets.Utils.Pixel.PixelBuffer):
+        x, y = indices
+        pads = y < 2
+        indexes = numpy.where(y[pads] == 0, 0x70, 0x60) + x[pads]
+        for index, color in zip(indexes.tolist(), self.quantizer.quantize(pixels.data[pads]).tolist()):
+            self.sendNoteOn(index, color)
 
     def connect(self, inPort: str = None, outPort: str = None):
         super().connect(inPort=inPort, outPort=outPort)
@@ -84,6 +84,11 @@ class MK2(PyxelWidgets.Controllers.MIDI.MIDI):
         rgb = pixel.grgb
         self._sysexBuffer.extend([3, index, rgb[0] >> 2, rgb[1] >> 2, rgb[2] >> 2])
 
+    def sendPixels(self, indices: tuple, pixels: PyxelWidgets.Utils.Pixel.PixelBuffer):
+        x, y = indices
+        message = numpy.column_stack((numpy.full(len(x), 3), (x + (y * 10)) & 0x7F, pixels.grgb >> 2))
+        self._sysexBuffer.extend(message.ravel().tolist())
+
     def connect(self, inPort: str = None, outPort: str = None):
         super().connect(inPort=inPort, outPort=outPort)
         self.setLayout(MK2.Layout.Session)
@@ -214,6 +219,11 @@ class MK3(PyxelWidgets.Controllers.MIDI.MIDI):
         rgb = pixel.grgb
         self._sysexBuffer.extend([3, index, rgb[0] >> 1, rgb[1] >> 1, rgb[2] >> 1])
 
+    def sendPixels(self, indices: tuple, pixels: PyxelWidgets.Utils.Pixel.PixelBuffer):
+        x, y = indices
+        message = numpy.column_stack((numpy.full(len(x), 3), (x + (y * 10)) & 0x7F, pixels.grgb >> 1))
+        self._sysexBuffer.extend(message.ravel().tolist())
+
     def connect(self, inPort: str = None, outPort: str = None):
         super().connect(inPort=inPort, outPort=outPort)
         self.setMode(MK3.Mode.Programmer)
@@ -286,6 +296,11 @@ class Pro(PyxelWidgets.Controllers.MIDI.MIDI):
         rgb = pixel.grgb
         self._sysexBuffer.extend([3, index, rgb[0] >> 2, rgb[1] >> 2, rgb[2] >> 2])
 
+    def sendPixels(self, indices: tuple, pixels: PyxelWidgets.Utils.Pixel.PixelBuffer):
+        x, y = indices
+        message = numpy.column_stack((numpy.full(len(x), 3), (x + (y * 10)) & 0x7F, pixels.grgb >> 2))
+        self._sysexBuffer.extend(message.ravel().tolist())
+
     def connect(self, inPort: str = None, outPort: str = None):
         super().connect(inPort=inPort, outPort=outPort)
         self.setLayout(Pro.Layout.Programmer)
@@ -20,8 +20,7 @@ class Controller():
         self.initialized = False
         self.connected = False
         self.terminated = False
-        self.buffer = numpy.ndarray((self.rect.w, self.rect.h), PyxelWidgets.Utils.Pixel.Pixel)
-        self.buffer.fill(PyxelWidgets.Utils.Pixel.Colors.Invisible)
+        self.buffer = PyxelWidgets.Utils.Pixel.PixelBuffer(self.rect.w, self.rect.h, PyxelWidgets.Utils.Pixel.Colors.Invisible)
         self.buttons = numpy.ndarray((self.rect.w, self.rect.h))
         self.buttons.fill(0.0)
         self.clock = PyxelWidgets.Utils.Clock.Clock()
@@ -91,6 +90,24 @@ class Controller():
     def sendPixel(self, x: int, y: int, pixel: PyxelWidgets.Utils.Pixel.Pixel):
         raise NotImplementedError("sendPixel method must be implemented")
 
+    def sendPixels(self, indices: tuple, pixels: PyxelWidgets.Utils.Pixel.PixelBuffer):
+        """
+        Description
+        ----
+        Send every changed pixel of an update at once.
+        Devices which could encode whole change set in one go should
+        override this, default implementation calls sendPixel per pixel.
+
+        Parameters
+        ----
+        indices: tuple
+            (x, y) integer arrays of changed cells
+        pixels: PixelBuffer
+            One dimensional buffer of new pixel values, same order as indices
+        """
+        for i, (x, y) in enumerate(zip(indices[0].tolist(), indices[1].tolist())):
+            self.sendPixel(x, y, pixels[i])
+
     def updateOne(self, x: int, y: int, pixel: PyxelWidgets.Utils.Pixel.Pixel):
         if self.connected:
             intersect = self.rect.intersect(PyxelWidgets.Utils.Rectangle.Rectangle2D(x, y, 1, 1))
@@ -133,9 +150,10 @@ class Controller():
             if self.connected:
                 intersect = self.rect.intersect(rect)
                 if intersect is not None:
-                    updated = numpy.where(buffer[(intersect - rect).slice] != self.buffer[intersect.slice], True, False)
-                    for x in intersect.columns:
-                        for y in intersect.rows:
-                            if updated[x - intersect.x, y - intersect.y]:
-                                self.buffer[x, y] = buffer[x - intersect.x, y - intersect.y]
-                                self.sendPixel(x, y, self.buffer[x, y])
\ No newline at end of file
+                    source = numpy.asarray(PyxelWidgets.Utils.Pixel.PixelBuffer.pack(buffer))[(intersect - rect).slice]
+                    columns, rows = numpy.nonzero(source != self.buffer.data[intersect.slice])
+                    if len(columns):
+                        values = source[columns, rows]
+                        indices = (columns + intersect.x, rows + intersect.y)
+                        self.buffer.data[indices] = values
+                        self.sendPixels(indices, PyxelWidgets.Utils.Pixel.PixelBuffer(data = values))
\ No newline at end of file
@@ -0,0 +1,217 @@
+import PyxelWidgets.Utils.Pixel
+import collections
+import os
+import numpy
+
+class FrameStore():
+    """
+    Description
+    ----
+    Frames of an animation as one (count, width, height) array of
+    packed 32-bit rgba values. Indexing returns a PixelBuffer view of
+    a frame, indexes wrap around frame count.
+
+    Parameters
+    ----
+    frames: list
+        PixelBuffers or (width, height) arrays of packed values
+    """
+    def __init__(self, frames) -> None:
+        self.data = numpy.stack([numpy.array(PyxelWidgets.Utils.Pixel.PixelBuffer.pack(frame), dtype = numpy.uint32) for frame in frames])
+
+    @property
+    def width(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.data.shape[2]
+
+    def frame(self, index: int) -> numpy.ndarray:
+        """ Packed values of frame """
+        return self.data[index % len(self)]
+
+    def __getitem__(self, index: int) -> PyxelWidgets.Utils.Pixel.PixelBuffer:
+        return PyxelWidgets.Utils.Pixel.PixelBuffer(data = self.frame(index))
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    @staticmethod
+    def save(path: str, frames) -> None:
+        """ Write frames as .npy file or as raw little endian uint32 (count, width, height) file for any other extension """
+        data = frames.data if isinstance(frames, FrameStore) else FrameStore(frames).data
+        if path.endswith('.npy'):
+            numpy.save(path, data)
+        else:
+            data.astype('<u4').tofile(path)
+
+class MappedFrameStore(FrameStore):
+    """
+    Description
+    ----
+    Frame store backed by a memory mapped file, opening doesn't read
+    any frame. Frames are copied out of the file when they are first
+    used, a few following frames are read with them in one sequential
+    read, and only the last used frames are kept in memory.
+
+    Parameters
+    ----
+    path: str
+        .npy file of (count, width, height) uint32 array or raw file of
+        little endian uint32 packed values
+    width: int = None
+        Frame width, needed for raw files
+    height: int = None
+        Frame height, needed for raw files
+    readAhead: int = 4
+        Number of following frames read together with a missing frame
+    cacheSize: int = 16
+        Number of frames kept in memory
+    """
+    def __init__(self, path: str, width: int = None, height: int = None, readAhead: int = 4, cacheSize: int = 16) -> None:
+        if path.endswith('.npy'):
+            self.data = numpy.load(path, mmap_mode = 'r')
+        else:
+            count = os.path.getsize(path) // (width * height * 4)
+            self.data = numpy.memmap(path, dtype = '<u4', mode = 'r', shape = (count, width, height))
+        self.readAhead = readAhead
+        self.cacheSize = max(cacheSize, readAhead + 1)
+        self._cache = collections.OrderedDict()
+
+    def frame(self, index: int) -> numpy.ndarray:
+        index %= len(self)
+        frame = self._cache.get(index)
+        if frame is not None:
+            self._cache.move_to_end(index)
+            return frame
+        stop = min(index + self.readAhead + 1, len(self))
+        block = numpy.array(self.data[index:stop], dtype = numpy.uint32)
+        for offset in range(len(block)):
+            self._cache[index + offset] = block[offset]
+            self._cache.move_to_end(index + offset)
+        while len(self._cache) > self.cacheSize:
+            self._cache.popitem(last = False)
+        return block[0]
+
+    def clear(self) -> None:
+        """ Drop cached frames """
+        self._cache.clear()
+
+class DeltaAnimation():
+    """
+    Description
+    ----
+    Delta encoded animation. Every keyframeInterval-th frame is kept
+    whole, every frame also keeps the cells which differ from previous
+    frame as flat indices and packed values. First frame keeps changes
+    from last frame, so looping playback is delta encoded too.
+    Playing frames in order only touches changed cells, any frame could
+    still be decoded starting from its keyframe.
+
+    Parameters
+    ----
+    frames: list
+        PixelBuffers or (width, height) arrays of packed values
+    keyframeInterval: int = 64
+        Distance between whole frames, bounds cost of random access
+    """
+    def __init__(self, frames = None, keyframeInterval: int = 64) -> None:
+        self.keyframeInterval = keyframeInterval
+        self.keyframes = numpy.zeros((0, 1, 1), dtype = numpy.uint32)
+        self.indices = numpy.zeros(0, dtype = numpy.uint32)
+        self.values = numpy.zeros(0, dtype = numpy.uint32)
+        self.offsets = numpy.zeros(1, dtype = numpy.int64)
+        if frames is not None:
+            self.encode(frames)
+
+    def encode(self, frames) -> None:
+        data = frames.data if isinstance(frames, FrameStore) else FrameStore(frames).data
+        count = data.shape[0]
+        flat = data.reshape(count, -1)
+        indices = []
+        values = []
+        self.offsets = numpy.zeros(count + 1, dtype = numpy.int64)
+        for index in range(count):
+            changed = numpy.flatnonzero(flat[index] != flat[index - 1])
+            indices.append(changed.astype(numpy.uint32))
+            values.append(flat[index][changed])
+            self.offsets[index + 1] = self.offsets[index] + len(changed)
+        self.indices = numpy.concatenate(indices)
+        self.values = numpy.concatenate(values)
+        self.keyframes = numpy.ascontiguousarray(data[::self.keyframeInterval])
+
+    @property
+    def width(self) -> int:
+        return self.keyframes.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.keyframes.shape[2]
+
+    def changes(self, index: int) -> tuple:
+        """ Flat indices and packed values of cells changed since previous frame """
+        index %= len(self)
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return self.indices[start:stop], self.values[start:stop]
+
+    def frame(self, index: int) -> numpy.ndarray:
+        """ Packed values of frame, decoded from its keyframe """
+        index %= len(self)
+        key = index // self.keyframeInterval
+        data = self.keyframes[key].copy()
+        flat = data.reshape(-1)
+        for current in range((key * self.keyframeInterval) + 1, index + 1):
+            indices, values = self.changes(current)
+            flat[indices] = values
+        return data
+
+    def apply(self, buffer: PyxelWidgets.Utils.Pixel.PixelBuffer, current: int, target: int) -> numpy.ndarray:
+        """
+        Description
+        ----
+        Bring buffer showing frame current to frame target in place and
+        return flat indices of changed cells. Skipped frames are applied
+        in order while that is cheaper than decoding from a keyframe.
+        """
+        count = len(self)
+        current %= count
+        target %= count
+        if target == current:
+            return self.indices[:0]
+        distance = (target - current) % count
+        if distance == 1 and buffer.data.flags.c_contiguous:
+            indices, values = self.changes(target)
+            buffer.data.reshape(-1)[indices] = values
+            return indices
+        if distance <= (target % self.keyframeInterval) and buffer.data.flags.c_contiguous:
+            flat = buffer.data.reshape(-1)
+            changed = []
+            for index in range(current + 1, current + distance + 1):
+                indices, values = self.changes(index)
+                flat[indices] = values
+                changed.append(indices)
+            return numpy.unique(numpy.concatenate(changed))
+        previous = buffer.data.copy()
+        buffer.data[...] = self.frame(target)
+        return numpy.flatnonzero(buffer.data != previous)
+
+    def __getitem__(self, index: int) -> PyxelWidgets.Utils.Pixel.PixelBuffer:
+        return PyxelWidgets.Utils.Pixel.PixelBuffer(data = self.frame(index))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def save(self, path: str) -> None:
+        numpy.savez(path, keyframeInterval = self.keyframeInterval, keyframes = self.keyframes, indices = self.indices, values = self.values, offsets = self.offsets)
+
+    @staticmethod
+    def load(path: str):
+        animation = DeltaAnimation()
+        with numpy.load(path) as data:
+            animation.keyframeInterval = int(data['keyframeInterval'])
+            animation.keyframes = data['keyframes']
+            animation.indices = data['indices']
+            animation.values = data['values']
+            animation.offsets = data['offsets']
+        return animation
@@ -1,7 +1,9 @@
 from concurrent.futures import ThreadPoolExecutor
 import enum
 from typing import Callable
-from threading import Thread
+from threading import Condition, Thread
+import heapq
+import itertools
 import time
 
 class Target:
@@ -60,7 +62,9 @@ class Clock(Thread):
         self.delay: float = 60.0 / (bpm * ppq)
         self.tick: int = 0
         self.currentTime: float = 0
+        self._stamp = (0, time.monotonic())
         self.targets = {}
+        self.schedulers = {}
         self.futures = {}
         self.running = True
         self._pause = False
@@ -74,7 +78,7 @@ class Clock(Thread):
     @bpm.setter
     def bpm(self, value: float) -> None:
         self._bpm = value
-        self.delay = 60.0 / (self._bpm * self._ppq)
+        self._setDelay(60.0 / (self._bpm * self._ppq))
     
     @property
     def ppq(self) -> float:
@@ -83,7 +87,15 @@ class Clock(Thread):
     @ppq.setter
     def ppq(self, value: float) -> None:
         self._ppq = value
-        self.delay = 60.0 / (self._bpm * self._ppq)
+        self._setDelay(60.0 / (self._bpm * self._ppq))
+
+    def _setDelay(self, delay: float) -> None:
+        """ Change tempo from current position on, events queued by schedulers are moved to new tempo """
+        now = time.monotonic()
+        self._stamp = (self.tickOf(now), now)
+        self.delay = delay
+        for scheduler in list(self.schedulers.values()):
+            scheduler.retime()
     
     @property
     def state(self) -> State:
@@ -103,6 +115,13 @@ class Clock(Thread):
         for target in targets:
             self.targets[target.name] = target
     
+    def addScheduler(self, scheduler) -> None:
+        self.schedulers[scheduler.name] = scheduler
+
+    def removeScheduler(self, name: str):
+        if name in self.schedulers:
+            return self.schedulers.pop(name)
+
     def removeTarget(self, name: str) -> Target:
         if name in self.targets:
             return self.targets.pop(name)
@@ -113,12 +132,26 @@ class Clock(Thread):
 
     def run(self):
         while not self._terminate:
-            self.currentTime = time.time()
+            self.currentTime = time.monotonic()
             self._step()
-            delay = self.delay - (time.time() - self.currentTime)
+            delay = self.delay - (time.monotonic() - self.currentTime)
             time.sleep(0.0 if delay < 0.0 else delay)
     
+    def timeOf(self, tick: float) -> float:
+        """ Estimated time.monotonic() time of tick, based on last step and current tempo """
+        stampTick, stampTime = self._stamp
+        return stampTime + ((tick - stampTick) * self.delay)
+
+    def tickOf(self, when: float) -> float:
+        """ Estimated tick at time.monotonic() time when, tick doesn't move while clock is paused or stopped """
+        stampTick, stampTime = self._stamp
+        if self.state != Clock.State.Running:
+            return stampTick
+        # clock never gets more than one tick past its last step
+        return stampTick + min(1.0, max(0.0, (when - stampTime) / self.delay))
+
     def step(self):
+        self._stamp = (self.tick, time.monotonic())
         for target in self.targets.values():
             if target.active:
                 self._pool.submit(target.set, self.tick)
@@ -129,8 +162,14 @@ class Clock(Thread):
         if self.running:
             self.step()
     
+    def _cancel(self):
+        """ Drop events queued by schedulers, widgets queue them again when clock runs """
+        for scheduler in list(self.schedulers.values()):
+            scheduler.cancel()
+
     def pause(self):
         self._pause = True
+        self._cancel()
     
     def resume(self):
         self._pause = False
@@ -138,11 +177,128 @@ class Clock(Thread):
     
     def reset(self):
         self.tick = 0
+        self._stamp = (0, time.monotonic())
     
     def stop(self):
         self.running = False
+        self._cancel()
         self.reset()
     
     def terminate(self):
         self._terminate = True
-        self._pool.shutdown(wait = True, cancel_futures = True)
\ No newline at end of file
+        self._pool.shutdown(wait = True, cancel_futures = True)
+
+class Scheduler(Thread):
+    """
+    Description
+    ----
+    Lookahead event queue for clock driven widgets.
+    Widgets schedule their upcoming events a lookahead window ahead of
+     the clock, events are kept ordered by time and called from this
+      thread at their time.monotonic() time, so event timing doesn't
+       depend on clock target or render delays.
+    Events queued by tick are moved when clock tempo changes, every
+     event is dropped when clock is paused or stopped and generation
+      is increased, so widgets know they have to queue events again.
+    Thread is started when first event is scheduled.
+
+    Parameters
+    ----
+    clock: Clock
+        Clock used to convert ticks to time
+    lookahead: float = 0.1
+        How far ahead events are scheduled, in seconds
+    """
+
+    _count = 0
+
+    def __init__(self, clock: Clock, lookahead: float = 0.1) -> None:
+        super().__init__(name = f'Scheduler_{Scheduler._count}', daemon = True)
+        self.clock = clock
+        self.lookahead = lookahead
+        self._queue = []
+        self._order = itertools.count()
+        self._condition = Condition()
+        self._terminate = False
+        self.generation = 0
+        clock.addScheduler(self)
+        Scheduler._count += 1
+
+    @property
+    def running(self) -> bool:
+        """ Whether clock is running, events are queued only while it runs """
+        return self.clock.state == Clock.State.Running
+
+    @property
+    def ticks(self) -> float:
+        """ Lookahead window in clock ticks at current tempo """
+        return self.lookahead / self.clock.delay
+
+    @property
+    def position(self) -> float:
+        """ Current clock tick, including part of tick elapsed since last step """
+        return self.clock.tickOf(time.monotonic())
+
+    def timeOf(self, tick: float) -> float:
+        return self.clock.timeOf(tick)
+
+    def schedule(self, when: float, callback: Callable, *args, tag = None) -> None:
+        """ Call callback(*args) at time.monotonic() time when """
+        with self._condition:
+            if self._terminate:
+                return
+            self._push(when, None, tag, callback, args)
+
+    def scheduleTick(self, tick: float, callback: Callable, *args, tag = None) -> None:
+        """ Call callback(*args) when clock reaches tick """
+        with self._condition:
+            if self._terminate:
+                return
+            self._push(self.timeOf(tick), tick, tag, callback, args)
+
+    def _push(self, when: float, tick: float, tag, callback: Callable, args: tuple) -> None:
+        heapq.heappush(self._queue, (when, next(self._order), tag, callback, args, tick))
+        if not self.is_alive():
+            self.start()
+        self._condition.notify()
+
+    def retime(self) -> None:
+        """ Recalculate time of events queued by tick, called by clock when tempo changes """
+        with self._condition:
+            self._queue = [event if event[5] is None else (self.timeOf(event[5]),) + event[1:] for event in self._queue]
+            heapq.heapify(self._queue)
+            self._condition.notify()
+
+    def cancel(self, tag = None) -> None:
+        """ Drop pending events with tag, or every pending event if tag is None """
+        with self._condition:
+            if tag is None:
+                self._queue.clear()
+                self.generation += 1
+            else:
+                self._queue = [event for event in self._queue if event[2] != tag]
+                heapq.heapify(self._queue)
+            self._condition.notify()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while not self._terminate:
+                    if not self._queue:
+                        self._condition.wait()
+                        continue
+                    delay = self._queue[0][0] - time.monotonic()
+                    if delay <= 0.0:
+                        break
+                    self._condition.wait(delay)
+                if self._terminate:
+                    return
+                _, _, _, callback, args, _ = heapq.heappop(self._queue)
+            callback(*args)
+
+    def terminate(self):
+        with self._condition:
+            self._terminate = True
+            self._queue.clear()
+            self._condition.notify()
+        self.clock.removeScheduler(self.name)
@@ -0,0 +1,82 @@
+import enum
+import numpy
+
+class Blend(enum.Enum):
+    """
+    Description
+    ----
+    Blend modes used while compositing a source over a destination.
+    Colors are blended with the source alpha, result alpha is always
+    source alpha over destination alpha.
+
+    Enums
+    ----
+    Over: source covers destination\n
+    Add: channels are summed and clipped\n
+    Multiply: channels are multiplied, result is darker\n
+    Screen: inverted channels are multiplied, result is lighter\n
+    Max: brightest channel wins
+    """
+    Over        = enum.auto()
+    Add         = enum.auto()
+    Multiply    = enum.auto()
+    Screen      = enum.auto()
+    Max         = enum.auto()
+
+def unpack(values: numpy.ndarray) -> tuple:
+    """ Split packed 32-bit rgba values into float alpha (...) and float rgb (..., 3) arrays in 0.0 - 1.0 range """
+    values = numpy.asarray(values, dtype = numpy.uint32)
+    alpha = ((values >> 24) & 0xFF) / 255.0
+    rgb = numpy.stack(((values >> 16) & 0xFF, (values >> 8) & 0xFF, values & 0xFF), axis = -1) / 255.0
+    return alpha, rgb
+
+def pack(alpha: numpy.ndarray, rgb: numpy.ndarray) -> numpy.ndarray:
+    """ Join float alpha and float rgb arrays in 0.0 - 1.0 range into packed 32-bit rgba values """
+    alpha = numpy.rint(numpy.clip(alpha, 0.0, 1.0) * 255.0).astype(numpy.uint32)
+    rgb = numpy.rint(numpy.clip(rgb, 0.0, 1.0) * 255.0).astype(numpy.uint32)
+    return (alpha << 24) | (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+def _blend(mode: Blend, source: numpy.ndarray, destination: numpy.ndarray) -> numpy.ndarray:
+    if mode == Blend.Over:
+        return source
+    elif mode == Blend.Add:
+        return numpy.minimum(source + destination, 1.0)
+    elif mode == Blend.Multiply:
+        return source * destination
+    elif mode == Blend.Screen:
+        return source + destination - (source * destination)
+    elif mode == Blend.Max:
+        return numpy.maximum(source, destination)
+    raise ValueError(f'Unknown blend mode {mode}')
+
+def composite(source: numpy.ndarray, destination: numpy.ndarray, mode: Blend = Blend.Over) -> numpy.ndarray:
+    """
+    Description
+    ----
+    Composite packed source values over packed destination values
+    and return the packed result. Arrays must have the same shape.
+
+    Parameters
+    ----
+    source: numpy.ndarray
+        Packed 32-bit rgba values placed on top
+    destination: numpy.ndarray
+        Packed 32-bit rgba values placed below
+    mode: Blend = Blend.Over
+        How source colors are combined with destination colors
+    """
+    source = numpy.asarray(source, dtype = numpy.uint32)
+    destination = numpy.asarray(destination, dtype = numpy.uint32)
+    if mode == Blend.Over:
+        # opaque sources fully cover the destination, skip the float math
+        if numpy.all((source >> 24) == 0xFF):
+            return source.copy()
+    sa, sc = unpack(source)
+    da, dc = unpack(destination)
+    oa = sa + (da * (1.0 - sa))
+    sa = sa[..., None]
+    da = da[..., None]
+    color = (sa * (1.0 - da) * sc) + (da * (1.0 - sa) * dc) + (sa * da * _blend(mode, sc, dc))
+    # both pixels invisible, keep color channels at zero
+    color /= numpy.where(oa > 0.0, oa, 1.0)[..., None]
+    return pack(oa, color)
@@ -0,0 +1,55 @@
+import numpy
+
+class Palette():
+    """
+    Nearest color lookup for palette based devices.
+    Every cell of a quantized rgb cube is matched against the palette once,
+    after that any number of pixels are mapped to palette indices with a
+    single gather instead of a distance search per pixel.
+    """
+    def __init__(self, colors, bits: int = 5) -> None:
+        self.colors = numpy.asarray(colors, dtype = numpy.int64)
+        self.bits = bits
+        self._shift = 8 - bits
+        self._cube = None
+
+    def __len__(self) -> int:
+        return len(self.colors)
+
+    @property
+    def cube(self) -> numpy.ndarray:
+        """ (size, size, size) palette indices, built on first use """
+        if self._cube is None:
+            self._cube = self._build()
+        return self._cube
+
+    def _build(self) -> numpy.ndarray:
+        size = 1 << self.bits
+        step = 1 << self._shift
+        centers = (numpy.arange(size) * step) + (step // 2)
+        g, b = numpy.meshgrid(centers, centers, indexing = 'ij')
+        plane = numpy.stack((numpy.zeros_like(g), g, b), axis = -1).reshape(-1, 1, 3)
+        cube = numpy.empty((size, size, size), dtype = numpy.min_scalar_type(len(self.colors) - 1))
+        # one red plane at a time keeps the distance matrix small
+        for r in range(size):
+            plane[..., 0] = centers[r]
+            deltas = plane - self.colors
+            distances = numpy.einsum('ijk,ijk->ij', deltas, deltas)
+            cube[r] = numpy.argmin(distances, axis = 1).reshape(size, size)
+        return cube
+
+    def find(self, pixel) -> int:
+        """ Palette index of a single pixel using alpha blended rgb value """
+        r, g, b = pixel.argb
+        shift = self._shift
+        return int(self.cube[r >> shift, g >> shift, b >> shift])
+
+    def quantize(self, values) -> numpy.ndarray:
+        """ Palette indices of packed 32-bit rgba values using alpha blended rgb """
+        values = numpy.asarray(values, dtype = numpy.uint32)
+        alpha = ((values >> 24) & 0xFF) / 255.0
+        shift = self._shift
+        r = (((values >> 16) & 0xFF) * alpha).astype(numpy.intp) >> shift
+        g = (((values >> 8) & 0xFF) * alpha).astype(numpy.intp) >> shift
+        b = ((values & 0xFF) * alpha).astype(numpy.intp) >> shift
+        return self.cube[r, g, b]
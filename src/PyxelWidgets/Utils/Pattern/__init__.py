@@ -0,0 +1,160 @@
+import numpy
+
+class Pattern():
+    """
+    Description
+    ----
+    Bit packed step storage for sequencers.
+    Gates of every track are kept as bits, 8 steps per byte, optional
+    lanes keep one value per step and track (velocity, probability...).
+    Storage grows in place by doubling its capacity, so extending a
+    pattern keeps every existing step.
+
+    Parameters
+    ----
+    steps: int = 16
+        Number of steps of every track
+    tracks: int = 1
+        Number of tracks
+    lanes: dict = None
+        Lane names and default values, for example {'velocity': 1.0}
+    """
+    def __init__(self, steps: int = 16, tracks: int = 1, lanes: dict = None) -> None:
+        self.tracks = tracks
+        self.defaults = dict(lanes or {})
+        self.bits = numpy.zeros((tracks, 0), dtype = numpy.uint8)
+        self.lanes = {name: numpy.full((tracks, 0), default, dtype = numpy.float32) for name, default in self.defaults.items()}
+        self._steps = 0
+        self.steps = steps
+
+    @property
+    def capacity(self) -> int:
+        """ Number of steps which fit without reallocation """
+        return self.bits.shape[1] * 8
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @steps.setter
+    def steps(self, value: int) -> None:
+        value = max(1, int(value))
+        if value > self.capacity:
+            self._grow(max(value, self.capacity * 2))
+        elif value < self._steps:
+            # forget dropped steps of every track so growing again starts from empty steps
+            first = value >> 3
+            if value & 7:
+                self.bits[:, first] &= numpy.uint8((1 << (value & 7)) - 1)
+                first += 1
+            self.bits[:, first:(self._steps + 7) >> 3] = 0
+            for name, lane in self.lanes.items():
+                lane[:, value:self._steps] = self.defaults[name]
+        self._steps = value
+
+    def _grow(self, capacity: int) -> None:
+        size = (capacity + 7) // 8
+        bits = numpy.zeros((self.tracks, size), dtype = numpy.uint8)
+        bits[:, :self.bits.shape[1]] = self.bits
+        self.bits = bits
+        for name, lane in self.lanes.items():
+            grown = numpy.full((self.tracks, size * 8), self.defaults[name], dtype = numpy.float32)
+            grown[:, :lane.shape[1]] = lane
+            self.lanes[name] = grown
+
+    def addLane(self, name: str, default: float = 0.0) -> numpy.ndarray:
+        """ Add a value lane if it doesn't exist and return it """
+        if name not in self.lanes:
+            self.defaults[name] = default
+            self.lanes[name] = numpy.full((self.tracks, self.capacity), default, dtype = numpy.float32)
+        return self.lanes[name]
+
+    def lane(self, name: str, track: int = 0) -> numpy.ndarray:
+        """ Writable view of a lane for one track """
+        return self.lanes[name][track, :self._steps]
+
+    def get(self, step: int, track: int = 0) -> bool:
+        step %= self._steps
+        return bool((self.bits[track, step >> 3] >> (step & 7)) & 1)
+
+    def set(self, step: int, state: bool = True, track: int = 0) -> None:
+        step %= self._steps
+        if state:
+            self.bits[track, step >> 3] |= numpy.uint8(1 << (step & 7))
+        else:
+            self.bits[track, step >> 3] &= numpy.uint8(~(1 << (step & 7)) & 0xFF)
+
+    def toggle(self, step: int, track: int = 0) -> bool:
+        step %= self._steps
+        self.bits[track, step >> 3] ^= numpy.uint8(1 << (step & 7))
+        return self.get(step, track)
+
+    def clear(self, track: int = None) -> None:
+        if track is None:
+            self.bits.fill(0)
+        else:
+            self.bits[track].fill(0)
+
+    def gates(self, start: int, stop: int, track: int = 0) -> numpy.ndarray:
+        """ Gates of steps in [start, stop) as bool array, steps after the last one are False """
+        start = max(0, start)
+        result = numpy.zeros(max(0, stop - start), dtype = numpy.bool_)
+        stop = min(stop, self._steps)
+        if stop > start:
+            first = start >> 3
+            bits = numpy.unpackbits(self.bits[track, first:(stop + 7) >> 3], bitorder = 'little')
+            result[:stop - start] = bits[start - (first * 8):stop - (first * 8)]
+        return result
+
+    def write(self, start: int, gates, track: int = 0) -> None:
+        """ Overwrite gates starting from step start, gates after the last step are dropped, only touched bytes are repacked """
+        gates = numpy.asarray(gates, dtype = numpy.bool_)
+        stop = min(start + len(gates), self._steps)
+        if stop <= start:
+            return
+        first = start >> 3
+        last = (stop + 7) >> 3
+        bits = numpy.unpackbits(self.bits[track, first:last], bitorder = 'little')
+        bits[start - (first * 8):stop - (first * 8)] = gates[:stop - start]
+        self.bits[track, first:last] = numpy.packbits(bits, bitorder = 'little')
+
+    def page(self, index: int, size: int, track: int = 0) -> numpy.ndarray:
+        """ Gates of one page, cost depends on page size only """
+        return self.gates(index * size, (index + 1) * size, track)
+
+    def unpack(self) -> numpy.ndarray:
+        """ (tracks, steps) bool array of every gate """
+        return numpy.unpackbits(self.bits, axis = 1, bitorder = 'little')[:, :self._steps].astype(numpy.bool_)
+
+    def query(self, start: float, stop: float, ticksPerStep: float = 1.0) -> tuple:
+        """
+        Description
+        ----
+        Active steps whose start falls into tick range [start, stop).
+        Pattern loops every steps * ticksPerStep ticks.
+
+        Returns
+        ----
+        tracks: numpy.ndarray
+            Track of every active step
+        steps: numpy.ndarray
+            Step index of every active step
+        ticks: numpy.ndarray
+            Tick where every active step starts
+        """
+        first = int(numpy.ceil(start / ticksPerStep))
+        last = int(numpy.ceil(stop / ticksPerStep))
+        if last <= first:
+            empty = numpy.zeros(0, dtype = numpy.intp)
+            return empty, empty, numpy.zeros(0, dtype = numpy.float64)
+        indexes = numpy.arange(first, last)
+        steps = indexes % self._steps
+        active = ((self.bits[:, steps >> 3] >> (steps & 7).astype(numpy.uint8)) & 1).astype(numpy.bool_)
+        tracks, columns = numpy.nonzero(active)
+        return tracks, steps[columns], indexes[columns] * ticksPerStep
+
+    def __len__(self) -> int:
+        return self._steps
+
+    def __repr__(self) -> str:
+        return f'Pattern({self._steps} steps, {self.tracks} tracks, lanes {list(self.lanes)})'
@@ -1,183 +1,224 @@
+import PyxelWidgets.Utils.Compositor
 import numpy
 
+def gammaTable(gamma: float = 2.2) -> numpy.ndarray:
+    """ 256 entry lookup table of gamma corrected 8-bit values, cached per gamma curve """
+    table = GammaTables.get(gamma)
+    if table is None:
+        table = ((numpy.arange(256) / 255.0) ** gamma * 255.0).astype(numpy.uint8)
+        table.flags.writeable = False
+        GammaTables[gamma] = table
+        _gammaLists[gamma] = table.tolist()
+    return table
+
+DefaultGamma = 2.2
+GammaTables = {}
+_gammaLists = {}
+gammaTable(DefaultGamma)
+
 class Pixel():
-    def __init__(self, r: int = 0, g: int = 0, b: int = 0, a: float = 1.0) -> None:
-        self.alpha = 0.0 if a < 0.0 else (1.0 if a > 1.0 else a)
-        
-        self.color = [0 if r < 0 else (255 if r > 255 else int(r)),
-                     0 if g < 0 else (255 if g > 255 else int(g)),
-                     0 if b < 0 else (255 if b > 255 else int(b))]
-
-        self.acolor = [int(self.color[0] * self.alpha),
-                       int(self.color[1] * self.alpha),
-                       int(self.color[2] * self.alpha)]
-
-        self.gammaCoefficient = ((1.0 / 255.0) ** 2.2) * 255
-        self.gcolor = [int((self.acolor[0] ** 2.2) * self.gammaCoefficient),
-                       int((self.acolor[1] ** 2.2) * self.gammaCoefficient),
-                       int((self.acolor[2] ** 2.2) * self.gammaCoefficient)]
-        
-        self._value = (int(self.alpha * 255) << 24) | (self.color[0] << 16) | (self.color[1] << 8) | self.color[2]
+    """
+    Immutable rgba color.
+    Pixels are interned by their packed 32-bit value through a bounded cache,
+    so equal colors usually share one instance and can be used as dict keys.
+    Results of multiplying a pixel by a coefficient are memoized as well.
+    Derived colors (alpha blended, gamma corrected, hsl) are calculated on
+    first access and kept in slots.
+    """
+
+    __slots__ = ('_value', '_color', '_acolor', '_gcolor', '_gmono', '_hsl')
+
+    cacheSize = 4096
+    scaleCacheSize = 4096
+    _cache = {}
+    _scaleCache = {}
+
+    def __new__(cls, r: int = 0, g: int = 0, b: int = 0, a: float = 1.0):
+        a = 0.0 if a < 0.0 else (1.0 if a > 1.0 else a)
+        return Pixel._pack(r, g, b, int(a * 255))
+
+    @staticmethod
+    def _pack(r, g, b, a: int):
+        r = int(r)
+        g = int(g)
+        b = int(b)
+        return Pixel.fromValue((a << 24) |
+                               ((0 if r < 0 else (255 if r > 255 else r)) << 16) |
+                               ((0 if g < 0 else (255 if g > 255 else g)) << 8) |
+                               (0 if b < 0 else (255 if b > 255 else b)))
+
+    @staticmethod
+    def fromValue(value: int):
+        """ Interned Pixel from raw 32-bit rgba value """
+        value = int(value) & 0xFFFFFFFF
+        pixel = Pixel._cache.get(value)
+        if pixel is None:
+            pixel = object.__new__(Pixel)
+            object.__setattr__(pixel, '_value', value)
+            for name in Pixel.__slots__[1:]:
+                object.__setattr__(pixel, name, None)
+            if len(Pixel._cache) >= Pixel.cacheSize:
+                Pixel._cache.pop(next(iter(Pixel._cache)))
+            Pixel._cache[value] = pixel
+        return pixel
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError('Pixel is immutable')
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError('Pixel is immutable')
+
+    def __reduce__(self):
+        return (Pixel.fromValue, (self._value, ))
 
     @property
-    def a(self) -> int:
+    def alpha(self) -> float:
+        """ Alpha as float between 0.0 and 1.0 """
+        return (self._value >> 24) / 255.0
+
+    @property
+    def a(self) -> float:
         return self.alpha
 
-    @a.setter
-    def a(self, value: float) -> None:
-        self.alpha = 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+    @property
+    def color(self) -> tuple:
+        """ Raw (red, green, blue) tuple """
+        if self._color is None:
+            value = self._value
+            object.__setattr__(self, '_color', ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF))
+        return self._color
 
-        self.acolor = [int(self.color[0] * self.alpha),
-                       int(self.color[1] * self.alpha),
-                       int(self.color[2] * self.alpha)]
+    @property
+    def acolor(self) -> tuple:
+        """ Alpha blended (red, green, blue) tuple """
+        if self._acolor is None:
+            alpha = self.alpha
+            color = self.color
+            object.__setattr__(self, '_acolor', (int(color[0] * alpha), int(color[1] * alpha), int(color[2] * alpha)))
+        return self._acolor
 
-        self.gammaCoefficient = ((1.0 / 256.0) ** 2.2) * 256.0
-        self.gcolor = [int((self.acolor[0] ** 2.2) * self.gammaCoefficient),
-                       int((self.acolor[1] ** 2.2) * self.gammaCoefficient),
-                       int((self.acolor[2] ** 2.2) * self.gammaCoefficient)]
-        
-        self._value &= 0x00FFFFFF
-        self._value |= (int(self.alpha * 255) << 24)
+    @property
+    def gcolor(self) -> tuple:
+        """ Alpha blended and gamma corrected (red, green, blue) tuple """
+        if self._gcolor is None:
+            table = _gammaLists[DefaultGamma]
+            acolor = self.acolor
+            object.__setattr__(self, '_gcolor', (table[acolor[0]], table[acolor[1]], table[acolor[2]]))
+        return self._gcolor
 
     @property
     def rgb(self):
         """ Raw (red, green, blue) tuple """
-        return self.color[0], self.color[1], self.color[2]
+        return self.color
 
     @property
     def frgb(self):
         """ Raw float (red, green, blue) tuple """
-        return self.color[0] / 256.0, self.color[1] / 256.0, self.color[2] / 256.0
+        color = self.color
+        return color[0] / 256.0, color[1] / 256.0, color[2] / 256.0
 
     @property
     def argb(self):
         """ Alpha blended (red, green, blue) tuple """
-        return self.acolor[0], self.acolor[1], self.acolor[2]
+        return self.acolor
     
     @property
     def fargb(self):
         """ Alpha blended float (red, green, blue) tuple """
-        return self.acolor[0] / 256.0, self.acolor[1] / 256.0, self.acolor[2] / 256.0
+        acolor = self.acolor
+        return acolor[0] / 256.0, acolor[1] / 256.0, acolor[2] / 256.0
 
     @property
     def grgb(self):
         """ Alpha blended and gamma corrected (red, green, blue) tuple """
-        return self.gcolor[0], self.gcolor[1], self.gcolor[2]
+        return self.gcolor
     
     @property
     def fgrgb(self):
         """ Alpha blended and gamma corrected float (red, green, blue) tuple """
-        return self.gcolor[0] / 256.0, self.gcolor[1] / 256.0, self.gcolor[2] / 256.0
+        gcolor = self.gcolor
+        return gcolor[0] / 256.0, gcolor[1] / 256.0, gcolor[2] / 256.0
+
+    def gammaRGB(self, gamma: float):
+        """ Alpha blended (red, green, blue) tuple corrected with given gamma curve """
+        if gamma not in _gammaLists:
+            gammaTable(gamma)
+        table = _gammaLists[gamma]
+        acolor = self.acolor
+        return table[acolor[0]], table[acolor[1]], table[acolor[2]]
 
     @property
     def r(self) -> int:
         """ Raw red color """
-        return self.color[0]
-    
-    @r.setter
-    def r(self, value: int) -> None:
-        value = int(value)
-        self.color[0] = 0 if value < 0 else (255 if value > 255 else value)
-        self.acolor[0] = int(self.color[0] * self.alpha)
-        self.gcolor[0] = int((self.acolor[0] ** 2.2) * self.gammaCoefficient)
-        self._value &= 0xFF00FFFF
-        self._value |= self.color[0] << 16
+        return (self._value >> 16) & 0xFF
 
     @property
     def g(self) -> int:
         """ Raw green color """
-        return self.color[1]
-    
-    @g.setter
-    def g(self, value: int) -> None:
-        value = int(value)
-        self.color[1] = 0 if value < 0 else (255 if value > 255 else value)
-        self.acolor[1] = int(self.color[1] * self.alpha)
-        self.gcolor[1] = int((self.acolor[1] ** 2.2) * self.gammaCoefficient)
-        self._value &= 0xFFFF00FF
-        self._value |= self.color[1] << 8
+        return (self._value >> 8) & 0xFF
 
     @property
     def b(self) -> int:
         """ Raw blue color """
-        return self.color[2]
-    
-    @b.setter
-    def b(self, value: int) -> None:
-        value = int(value)
-        self.color[2] = 0 if value < 0 else (255 if value > 255 else value)
-        self.acolor[2] = int(self.color[2] * self.alpha)
-        self.gcolor[2] = int((self.acolor[2] ** 2.2) * self.gammaCoefficient)
-        self._value &= 0xFFFFFF00
-        self._value |= self.color[0]
+        return self._value & 0xFF
+
+    @property
+    def hsl(self) -> tuple:
+        """ (hue, saturation, luminance) tuple calculated from alpha blended rgb """
+        if self._hsl is None:
+            h = 0.0
+            s = 0.0
+            rgb = self.fargb
+            minV = min(rgb)
+            maxV = max(rgb)
+            l = (maxV + minV) / 2.0
+            if maxV != minV:
+                if maxV == rgb[0]:
+                    h = (rgb[1] - rgb[2]) / (maxV - minV)
+                elif maxV == rgb[1]:
+                    h = 2.0 + ((rgb[2] - rgb[0]) / (maxV - minV))
+                else:
+                    h = 4.0 + ((rgb[0] - rgb[1]) / (maxV - minV))
+                if l <= 0.5:
+                    s = (maxV - minV) / (maxV + minV)
+                else:
+                    s = (maxV - minV) / (2.0 - maxV - minV)
+            object.__setattr__(self, '_hsl', (int(h * 60 if h >= 0 else (h * 60) + 360), s, l))
+        return self._hsl
 
     @property
     def h(self) -> int:
         """ Hue value calculated from alpha blended rgb """
-        h = 0.0
-        rgb = self.fargb
-        minV = min(rgb)
-        maxV = max(rgb)
-        if maxV == rgb[0]:
-            h = (rgb[1] - rgb[2]) / (maxV - minV)
-        elif maxV == rgb[1]:
-            h = 2.0 + ((rgb[2] - rgb[0]) / (maxV - minV))
-        elif maxV == rgb[2]:
-            h = 4.0 + ((rgb[0] - rgb[1]) / (maxV - minV))
-        return int(h * 60 if h >= 0 else (h * 60) + 360)
+        return self.hsl[0]
 
     @property
     def s(self) -> float:
         """ Saturation value calculated from alpha blended rgb """
-        rgb = self.fargb
-        minV = min(rgb)
-        maxV = max(rgb)
-        if self.l <= 0.5:
-            return (maxV - minV) / (maxV + minV)
-        return (maxV - minV) / (2.0 - maxV - minV)
+        return self.hsl[1]
 
     @property
     def l(self) -> float:
         """ Luminance value calculated from alpha blended rgb """
-        rgb = self.fargb
-        minV = min(rgb)
-        maxV = max(rgb)
-        return (maxV + minV) / 2.0
+        return self.hsl[2]
     
     @property
     def mono(self) -> int:
         """ Linear monophonic color calculated from alpha blended rgb """
-        return int((self.acolor[0] * 0.2126) + (self.acolor[1] * 0.7152) + (self.acolor[2] * 0.0722))
+        acolor = self.acolor
+        return int((acolor[0] * 0.2126) + (acolor[1] * 0.7152) + (acolor[2] * 0.0722))
     
     @property
     def gmono(self) -> int:
         """ Linear monophonic color calculated from alpha blended rgb then applied gamma correction """
-        return int((((self.acolor[0] * 0.2126) ** 2.2) * self.gammaCoefficient) + 
-                   (((self.acolor[1] * 0.7152) ** 2.2) * self.gammaCoefficient) + 
-                   (((self.acolor[2] * 0.0722) ** 2.2) * self.gammaCoefficient))
+        if self._gmono is None:
+            object.__setattr__(self, '_gmono', _gammaLists[DefaultGamma][self.mono])
+        return self._gmono
 
     @property
     def value(self) -> int:
         """ Raw 32-bit rgba value """
         return self._value
-    
-    @value.setter
-    def value(self, value: int) -> None:
-        self._value = value & 0xFFFFFFFF
-        self.alpha = ((self._value >> 24) & 0xFF) / 255.0
-
-        self.color[0] = (self._value >> 16) & 0xFF
-        self.color[1] = (self._value >> 8) & 0xFF
-        self.color[2] = self._value & 0xFF
-        
-        self.acolor = [int(self.color[0] * self.alpha),
-                       int(self.color[1] * self.alpha),
-                       int(self.color[2] * self.alpha)]
-        
-        self.gcolor = [int((self.acolor[0] ** 2.2) * self.gammaCoefficient),
-                       int((self.acolor[1] ** 2.2) * self.gammaCoefficient),
-                       int((self.acolor[2] ** 2.2) * self.gammaCoefficient)]
-    
+
     def findInPalette(self, palette):
         """ Find in palette using alpha blended rgb value """
         palette = numpy.asarray(palette)
@@ -185,10 +226,17 @@ class Pixel():
         dist_2 = numpy.einsum('ij,ij->i', deltas, deltas)
         return numpy.argmin(dist_2)
 
+    def __hash__(self) -> int:
+        return hash(self._value)
+
     def __eq__(self, other) -> bool:
+        if not isinstance(other, Pixel):
+            return NotImplemented
         return self._value == other._value
     
     def __ne__(self, other) -> bool:
+        if not isinstance(other, Pixel):
+            return NotImplemented
         return self._value != other._value
     
     def __lt__(self, other) -> bool:
@@ -198,36 +246,42 @@ class Pixel():
         return self.l > other.l
     
     def __le__(self, other) -> bool:
-        result = [min(s, o) for s, o in zip(self.color, other.color)] + [min(self.alpha, other.alpha)]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [min(s, o) for s, o in zip(self.color, other.color)]
+        return Pixel._pack(result[0], result[1], result[2], min(self._value >> 24, other._value >> 24))
 
     def __ge__(self, other) -> bool:
-        result = [max(s, o) for s, o in zip(self.color, other.color)] + [max(self.alpha, other.alpha)]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [max(s, o) for s, o in zip(self.color, other.color)]
+        return Pixel._pack(result[0], result[1], result[2], max(self._value >> 24, other._value >> 24))
 
     def __add__(self, other: int):
-        result = [s + o for s, o in zip(self.color, other.color)] + [self.alpha + other.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [s + o for s, o in zip(self.color, other.color)]
+        return Pixel._pack(result[0], result[1], result[2], min(255, (self._value >> 24) + (other._value >> 24)))
     
     def __sub__(self, other: int):
-        result = [s - o for s, o in zip(self.color, other.color)] + [self.alpha - other.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [s - o for s, o in zip(self.color, other.color)]
+        return Pixel._pack(result[0], result[1], result[2], max(0, (self._value >> 24) - (other._value >> 24)))
     
     def __mul__(self, other: float):
-        result = [s * other for s in self.color] + [self.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        key = (self._value, other)
+        pixel = Pixel._scaleCache.get(key)
+        if pixel is None:
+            pixel = Pixel._pack(self.color[0] * other, self.color[1] * other, self.color[2] * other, self._value >> 24)
+            if len(Pixel._scaleCache) >= Pixel.scaleCacheSize:
+                Pixel._scaleCache.pop(next(iter(Pixel._scaleCache)))
+            Pixel._scaleCache[key] = pixel
+        return pixel
     
     def __truediv__(self, other: float):
-        result = [s / other for s in self.color] + [self.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [s / other for s in self.color]
+        return Pixel._pack(result[0], result[1], result[2], self._value >> 24)
     
     def __floordiv__(self, other: float):
-        result = [s // other for s in self.color] + [self.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [s // other for s in self.color]
+        return Pixel._pack(result[0], result[1], result[2], self._value >> 24)
 
     def __mod__(self, other: int):
-        result = [s % other for s in self.color] + [self.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [s % other for s in self.color]
+        return Pixel._pack(result[0], result[1], result[2], self._value >> 24)
 
     def __lshift__(self, other):
         invalpha = 1.0 - self.alpha
@@ -242,33 +296,185 @@ class Pixel():
         return Pixel(result[0], result[1], result[2], result[3])
 
     def __and__(self, other: int):
-        result = [s & other for s in self.color] + [self.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [s & other for s in self.color]
+        return Pixel._pack(result[0], result[1], result[2], self._value >> 24)
 
     def __or__(self, other: int):
-        result = [s | other for s in self.color] + [self.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [s | other for s in self.color]
+        return Pixel._pack(result[0], result[1], result[2], self._value >> 24)
     
     def __xor__(self, other):
-        result = [s ^ other for s in self.color] + [self.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [s ^ other for s in self.color]
+        return Pixel._pack(result[0], result[1], result[2], self._value >> 24)
 
     def __bool__(self):
-        return bool(self.alpha)
+        return bool(self._value >> 24)
 
     def __invert__(self):
-        result = [255 - s for s in self.color] + [1.0 - self.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [255 - s for s in self.color]
+        return Pixel._pack(result[0], result[1], result[2], 255 - (self._value >> 24))
 
     def __neg__(self):
-        result = [255 - s for s in self.color] + [1.0 - self.alpha]
-        return Pixel(result[0], result[1], result[2], result[3])
+        result = [255 - s for s in self.color]
+        return Pixel._pack(result[0], result[1], result[2], 255 - (self._value >> 24))
     
     def __index__(self):
         return self._value
 
     def __repr__(self) -> str:
-        return f'({self.color.__repr__()}, {self.alpha.__repr__()})'
+        return f'({list(self.color).__repr__()}, {self.alpha.__repr__()})'
+
+class PixelBuffer():
+    """
+    Two dimensional framebuffer of packed 32-bit rgba values.
+    Values have the same layout as Pixel.value, so whole buffers can be
+    filled, compared, scaled and composited with a few numpy calls.
+    Indexing with a single cell returns a Pixel, indexing with slices
+    returns a PixelBuffer view sharing the same memory.
+    """
+    def __init__(self, width: int = 1, height: int = 1, fill: Pixel = None, data: numpy.ndarray = None) -> None:
+        if data is None:
+            data = numpy.zeros((width, height), dtype = numpy.uint32)
+            if fill is not None:
+                data.fill(fill.value)
+        self.data = data
+
+    @staticmethod
+    def pack(value):
+        """ Packed value(s) of a Pixel, PixelBuffer, int or array of those """
+        if isinstance(value, Pixel):
+            return value.value
+        if isinstance(value, PixelBuffer):
+            return value.data
+        if isinstance(value, numpy.ndarray):
+            if value.dtype == object:
+                return numpy.fromiter((PixelBuffer.pack(v) for v in value.flat), dtype = numpy.uint32, count = value.size).reshape(value.shape)
+            return value.astype(numpy.uint32, copy = False)
+        return int(value) & 0xFFFFFFFF
+
+    @staticmethod
+    def where(condition, x, y):
+        """ Vectorized select between two pixels or buffers """
+        return PixelBuffer(data = numpy.where(condition, PixelBuffer.pack(x), PixelBuffer.pack(y)).astype(numpy.uint32))
+
+    @property
+    def shape(self) -> tuple:
+        return self.data.shape
+
+    @property
+    def width(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def height(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def a(self) -> numpy.ndarray:
+        """ Raw 8-bit alpha channel """
+        return (self.data >> 24) & 0xFF
+
+    @property
+    def r(self) -> numpy.ndarray:
+        """ Raw red channel """
+        return (self.data >> 16) & 0xFF
+
+    @property
+    def g(self) -> numpy.ndarray:
+        """ Raw green channel """
+        return (self.data >> 8) & 0xFF
+
+    @property
+    def b(self) -> numpy.ndarray:
+        """ Raw blue channel """
+        return self.data & 0xFF
+
+    @property
+    def argb(self) -> numpy.ndarray:
+        """ Alpha blended (..., 3) red, green, blue channels """
+        alpha = self.a / 255.0
+        return (numpy.stack((self.r, self.g, self.b), axis = -1) * alpha[..., None]).astype(numpy.uint8)
+
+    @property
+    def grgb(self) -> numpy.ndarray:
+        """ Alpha blended and gamma corrected (..., 3) red, green, blue channels """
+        return GammaTables[DefaultGamma][self.argb]
+
+    @property
+    def visible(self) -> numpy.ndarray:
+        """ Mask of cells with non-zero alpha """
+        return (self.data & 0xFF000000) != 0
+
+    def fill(self, pixel: Pixel) -> None:
+        self.data.fill(PixelBuffer.pack(pixel))
+
+    def copy(self):
+        return PixelBuffer(data = self.data.copy())
+
+    def resize(self, width: int, height: int, fill: Pixel = None) -> None:
+        """ Resize in place, keeping overlapping cells and filling new ones """
+        data = numpy.zeros((width, height), dtype = numpy.uint32)
+        if fill is not None:
+            data.fill(fill.value)
+        w = min(width, self.width)
+        h = min(height, self.height)
+        data[:w, :h] = self.data[:w, :h]
+        self.data = data
+
+    def blit(self, source, x: int = 0, y: int = 0, mask: numpy.ndarray = None) -> None:
+        """ Copy source into this buffer at (x, y), optionally only where mask is True """
+        source = numpy.asarray(PixelBuffer.pack(source))
+        target = self.data[x:x + source.shape[0], y:y + source.shape[1]]
+        source = source[:target.shape[0], :target.shape[1]]
+        if mask is None:
+            target[...] = source
+        else:
+            numpy.copyto(target, source, where = mask[:target.shape[0], :target.shape[1]])
+
+    def compare(self, other) -> numpy.ndarray:
+        """ Mask of cells which differ from other """
+        return self.data != PixelBuffer.pack(other)
+
+    def scale(self, coefficient):
+        """ Multiply rgb channels by coefficient (scalar or array), alpha is kept """
+        coefficient = numpy.asarray(coefficient, dtype = numpy.float64)
+        r = numpy.clip(self.r * coefficient, 0, 255).astype(numpy.uint32)
+        g = numpy.clip(self.g * coefficient, 0, 255).astype(numpy.uint32)
+        b = numpy.clip(self.b * coefficient, 0, 255).astype(numpy.uint32)
+        return PixelBuffer(data = (self.data & 0xFF000000) | (r << 16) | (g << 8) | b)
+
+    def composite(self, source, x: int = 0, y: int = 0, mode: PyxelWidgets.Utils.Compositor.Blend = PyxelWidgets.Utils.Compositor.Blend.Over) -> None:
+        """ Blend source over this buffer in place, source placed at (x, y) """
+        source = numpy.asarray(PixelBuffer.pack(source))
+        target = self.data[x:x + source.shape[0], y:y + source.shape[1]]
+        source = source[:target.shape[0], :target.shape[1]]
+        target[...] = PyxelWidgets.Utils.Compositor.composite(source, target, mode)
+
+    def __getitem__(self, key):
+        data = self.data[key]
+        if numpy.ndim(data) == 0:
+            return Pixel.fromValue(int(data))
+        return PixelBuffer(data = data)
+
+    def __setitem__(self, key, value) -> None:
+        self.data[key] = PixelBuffer.pack(value)
+
+    def __eq__(self, other) -> numpy.ndarray:
+        return self.data == PixelBuffer.pack(other)
+
+    def __ne__(self, other) -> numpy.ndarray:
+        return self.data != PixelBuffer.pack(other)
+
+    __hash__ = None
+
+    def __mul__(self, other: float):
+        return self.scale(other)
+
+    def __array__(self, dtype = None, copy = None) -> numpy.ndarray:
+        return self.data if dtype is None else self.data.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f'PixelBuffer({self.data.shape})'
 
 class Colors:
     IndianRed = Pixel(205, 92, 92)
@@ -1,4 +1,4 @@
-
+import numpy
 
 class Position2D():
     def __init__(self, x: int = 0, y: int = 0) -> None:
@@ -78,8 +78,7 @@ class Rectangle2D(Position2D, Dimension2D):
     def set(self, x: int, y: int, w: int, h: int) -> None:
         self.x = x
         self.y = y
-        self.w = w
-        self.h = h
+        Dimension2D.set(self, w, h)
     
     def get(self) -> tuple:
         return self.x, self.y, self.w, self.h
@@ -102,6 +101,15 @@ class Rectangle2D(Position2D, Dimension2D):
                 self.y < rect.y + rect.h and 
                 rect.y < self.y + self.h)
 
+    def union(self, rect):
+        x = min(self.l, rect.l)
+        y = min(self.b, rect.b)
+        return Rectangle2D(x, y, max(self.r, rect.r) - x, max(self.t, rect.t) - y)
+
+    def contains(self, rect):
+        return (self.l <= rect.l and rect.r <= self.r and
+                self.b <= rect.b and rect.t <= self.t)
+
     def __add__(self, other):
         return Rectangle2D(self.x + other.x, self.y + other.y, self.w, self.h)
     
@@ -109,4 +117,106 @@ class Rectangle2D(Position2D, Dimension2D):
         return Rectangle2D(self.x - other.x, self.y - other.y, self.w, self.h)
 
     def __repr__(self) -> str:
-        return f'({self.x}, {self.y}, {self.w}, {self.h})'
\ No newline at end of file
+        return f'({self.x}, {self.y}, {self.w}, {self.h})'
+
+class Region():
+    """
+    Description
+    ----
+    Set of damaged rectangles.
+    Rectangles are merged while they are added if merging does not cover
+    any extra cell, if rectangle count exceeds limit whole region
+    collapses into its bounding box.
+
+    Parameters
+    ----
+    rects: list = None
+        Initial rectangles
+    limit: int = 16
+        Maximum rectangle count before collapsing
+    """
+    def __init__(self, rects: list = None, limit: int = 16) -> None:
+        self.rects = []
+        self.limit = limit
+        for rect in rects or []:
+            self.add(rect)
+
+    @staticmethod
+    def fromMask(mask, x: int = 0, y: int = 0, limit: int = 16):
+        """ Region covering True cells of a (w, h) boolean mask placed at x, y """
+        mask = numpy.asarray(mask, dtype = numpy.bool_)
+        edges = numpy.diff(numpy.pad(mask, ((0, 0), (1, 1))).astype(numpy.int8), axis = 1)
+        columns, starts = numpy.nonzero(edges == 1)
+        _, ends = numpy.nonzero(edges == -1)
+        region = Region(limit = limit)
+        # vertical runs of every column, neighbour columns with same run merge
+        for column, start, end in zip(columns.tolist(), starts.tolist(), ends.tolist()):
+            region.add(Rectangle2D(x + column, y + start, 1, end - start))
+        return region
+
+    @property
+    def bounds(self) -> Rectangle2D:
+        """ Bounding box of region, None if region is empty """
+        bounds = None
+        for rect in self.rects:
+            bounds = rect.copy() if bounds is None else bounds.union(rect)
+        return bounds
+
+    def add(self, rect: Rectangle2D) -> None:
+        if rect is None or rect.w <= 0 or rect.h <= 0:
+            return
+        rect = rect.copy()
+        merged = True
+        while merged:
+            merged = False
+            for index, other in enumerate(self.rects):
+                union = rect.union(other)
+                overlap = rect.intersect(other)
+                shared = 0 if overlap is None else overlap.w * overlap.h
+                if union.w * union.h <= (rect.w * rect.h) + (other.w * other.h) - shared:
+                    del self.rects[index]
+                    rect = union
+                    merged = True
+                    break
+        self.rects.append(rect)
+        if len(self.rects) > self.limit:
+            self.rects = [self.bounds]
+
+    def union(self, region):
+        result = Region(self.rects, self.limit)
+        for rect in region:
+            result.add(rect)
+        return result
+
+    def coalesce(self) -> None:
+        rects = self.rects
+        self.rects = []
+        for rect in rects:
+            self.add(rect)
+
+    def clip(self, rect: Rectangle2D):
+        result = Region(limit = self.limit)
+        if rect is not None:
+            for other in self.rects:
+                result.add(other.intersect(rect))
+        return result
+
+    def translate(self, x: int, y: int):
+        result = Region(limit = self.limit)
+        result.rects = [Rectangle2D(rect.x + x, rect.y + y, rect.w, rect.h) for rect in self.rects]
+        return result
+
+    def clear(self) -> None:
+        self.rects = []
+
+    def __iter__(self):
+        return iter(self.rects)
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def __bool__(self) -> bool:
+        return len(self.rects) > 0
+
+    def __repr__(self) -> str:
+        return f'Region{self.rects}'
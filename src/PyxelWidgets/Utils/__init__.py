@@ -1 +1 @@
-__all__ = ['Clock', 'Effect', 'Enums', 'Parser', 'Pixel', 'Rectangle', 'teVirtualMIDI']
\ No newline at end of file
+__all__ = ['Animation', 'Clock', 'Compositor', 'Effect', 'Enums', 'Palette', 'Parser', 'Pattern', 'Pixel', 'Rectangle', 'teVirtualMIDI']
\ No newline at end of file
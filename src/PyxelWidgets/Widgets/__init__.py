@@ -1,7 +1,13 @@
+import PyxelWidgets.Utils.Animation
+import PyxelWidgets.Utils.Clock
+import PyxelWidgets.Utils.Compositor
 import PyxelWidgets.Utils.Enums
 import PyxelWidgets.Utils.Pixel
 import PyxelWidgets.Utils.Rectangle
 import PyxelWidgets.Utils.Effect
+import PyxelWidgets.Utils.Pattern
+import collections
+import time
 import uuid
 import numpy
 import enum
@@ -41,6 +47,14 @@ class Widget:
             If widget value is zero, this color will be used.
         value: float = 0.0, optional
             Default value of widget.
+        blend: Blend = Blend.Over, optional
+            How widget pixels are composited over widgets below it.
+        renderCache: int = 0, optional
+            Number of rendered frames kept for reuse, 0 disables caching.
+            Frames are keyed by value quantized to renderSteps and
+            render settings of widget, useful for widgets driven by MIDI CC.
+        renderSteps: int = 128, optional
+            Value quantization steps of render cache.
         
         Returns
         -------
@@ -48,14 +62,19 @@ class Widget:
             new Widget instance
         """    
         self.id = uuid.uuid1()
+        self._windows = []
+        self._updated = True
+        self._frames = collections.OrderedDict()
+        self.renderCache = kwargs.get('renderCache', 0)
+        self.renderSteps = kwargs.get('renderSteps', 128)
         self.name = kwargs.get('name', f'Widget_{Widget._count}')
         self.rect = PyxelWidgets.Utils.Rectangle.Rectangle2D(x, y, width, height)
         self.activeColor = kwargs.get('activeColor', PyxelWidgets.Utils.Pixel.Colors.White)
         self.deactiveColor = kwargs.get('deactiveColor', PyxelWidgets.Utils.Pixel.Colors.Black)
+        self.blend = kwargs.get('blend', PyxelWidgets.Utils.Compositor.Blend.Over)
         self.delta = 0.0
         self.updated = True
-        self.buffer = numpy.ndarray((self.rect.w, self.rect.h), PyxelWidgets.Utils.Pixel.Pixel)
-        self.buffer.fill(self.deactiveColor)
+        self.buffer = PyxelWidgets.Utils.Pixel.PixelBuffer(self.rect.w, self.rect.h, self.deactiveColor)
         self.lock = kwargs.get('lock', False)
         self._value = kwargs.get('value', 0.0)
         self._oldValue = self._value
@@ -70,10 +89,14 @@ class Widget:
     def width(self, value: int) -> None:
         if value > 0:
             if self._resize(value, self.rect.h):
-                self.rect.w = value
-                self.buffer.resize((self.rect.w, self.rect.h), refcheck = False)
-                self.buffer = numpy.where(self.buffer == 0, self.deactiveColor, self.buffer)
+                area = self.rect.copy()
+                self.rect.set(self.rect.x, self.rect.y, value, self.rect.h)
+                self.buffer.resize(self.rect.w, self.rect.h, self.deactiveColor)
+                self.clearRenderCache()
                 self.updated = True
+                for window in self._windows:
+                    window.reindex()
+                    window.redraw(area.union(self.rect))
                 self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Resized, (self.rect.w, self.rect.h))
 
     @property
@@ -84,12 +107,47 @@ class Widget:
     def height(self, value: int) -> None:
         if value > 0:
             if self._resize(self.rect.w, value):
-                self.rect.h = value
-                self.buffer.resize((self.rect.w, self.rect.h), refcheck = False)
-                self.buffer = numpy.where(self.buffer == 0, self.deactiveColor, self.buffer)
+                area = self.rect.copy()
+                self.rect.set(self.rect.x, self.rect.y, self.rect.w, value)
+                self.buffer.resize(self.rect.w, self.rect.h, self.deactiveColor)
+                self.clearRenderCache()
                 self.updated = True
+                for window in self._windows:
+                    window.reindex()
+                    window.redraw(area.union(self.rect))
                 self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Resized, (self.rect.w, self.rect.h))
 
+    @property
+    def activeColor(self) -> PyxelWidgets.Utils.Pixel.Pixel:
+        return self._activeColor
+
+    @activeColor.setter
+    def activeColor(self, color: PyxelWidgets.Utils.Pixel.Pixel) -> None:
+        self._activeColor = color
+        self.clearRenderCache()
+        self.updated = True
+
+    @property
+    def deactiveColor(self) -> PyxelWidgets.Utils.Pixel.Pixel:
+        return self._deactiveColor
+
+    @deactiveColor.setter
+    def deactiveColor(self, color: PyxelWidgets.Utils.Pixel.Pixel) -> None:
+        self._deactiveColor = color
+        self.clearRenderCache()
+        self.updated = True
+
+    @property
+    def updated(self) -> bool:
+        return self._updated
+
+    @updated.setter
+    def updated(self, value: bool) -> None:
+        self._updated = value
+        if value:
+            for window in self._windows:
+                window.markDirty(self)
+
     @property
     def value(self) -> float:
         return self._value
@@ -114,17 +172,17 @@ class Widget:
     def process(self, name, event, data):
         if event != PyxelWidgets.Utils.Enums.Event.Custom:
             x, y, value = data
-            btn = PyxelWidgets.Utils.Rectangle.Rectangle2D(x, y)
-            if btn.collide(self.rect):
-                btn = btn - self.rect
+            x -= self.rect.x
+            y -= self.rect.y
+            if 0 <= x < self.rect.w and 0 <= y < self.rect.h:
                 if event == PyxelWidgets.Utils.Enums.Event.Pressed:
-                    self.pressed(btn.x, btn.y, value)
+                    self.pressed(x, y, value)
                 elif event == PyxelWidgets.Utils.Enums.Event.Released:
-                    self.released(btn.x, btn.y, value)
+                    self.released(x, y, value)
                 elif event == PyxelWidgets.Utils.Enums.Event.Held:
-                    self.held(btn.x, btn.y, value)
+                    self.held(x, y, value)
                 elif event == PyxelWidgets.Utils.Enums.Event.DoublePressed:
-                    self.doublePressed(btn.x, btn.y, value)
+                    self.doublePressed(x, y, value)
 
     def press(self, x: int, y: int, value: float):
         return
@@ -224,6 +282,16 @@ class Widget:
         self.released(x, y, releaseValue)
 
     def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D) -> tuple:
+        """
+        Description
+        ----
+        Render widget pixels inside rect and return (intersect, buffer)
+         or (None, None) if nothing is updated.
+          Widgets could return (intersect, buffer, changes) instead,
+           changes is a boolean mask shaped like buffer or a list of
+            (x, y) cells relative to intersect, only those cells are
+             recomposed by Window.
+        """
         return rect, self.buffer[rect.slice]
 
     def update(self) -> tuple:
@@ -241,6 +309,112 @@ class Widget:
     def _resize(self, width, height) -> bool:
         return True
 
+    def clearRenderCache(self) -> None:
+        self._frames.clear()
+
+    def _renderConfig(self) -> tuple:
+        """ Settings which change rendered pixels besides value, size and colors, used as part of render cache key """
+        return ()
+
+    def _cacheKey(self) -> tuple:
+        steps = self.renderSteps - 1
+        if isinstance(self._value, list):
+            value = tuple(round(v * steps) for v in self._value)
+        else:
+            value = round(self._value * steps)
+        return (value, self.rect.w, self.rect.h, self._activeColor.value, self._deactiveColor.value) + self._renderConfig()
+
+    def _renderValue(self):
+        """ Value to render, quantized to renderSteps while render cache is on so cached and fresh frames are the same """
+        if self.renderCache > 0:
+            steps = self.renderSteps - 1
+            if isinstance(self._value, list):
+                return [round(round(v * steps) / steps, 6) for v in self._value]
+            return round(round(self._value * steps) / steps, 6)
+        return self._value
+
+    def _restoreFrame(self, area: PyxelWidgets.Utils.Rectangle.Rectangle2D) -> bool:
+        """ Copy cached frame of current value into area, returns False if there is none """
+        if self.renderCache > 0:
+            key = self._cacheKey()
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self.buffer.data[area.slice] = frame[area.slice]
+                return True
+        return False
+
+    def _storeFrame(self, area: PyxelWidgets.Utils.Rectangle.Rectangle2D) -> None:
+        """ Keep rendered frame of current value, only complete frames are kept """
+        if self.renderCache > 0 and area.w == self.rect.w and area.h == self.rect.h:
+            self._frames[self._cacheKey()] = self.buffer.data.copy()
+            if len(self._frames) > self.renderCache:
+                self._frames.popitem(last = False)
+
+    @staticmethod
+    def _levels(shape: tuple, conditions: list, levels: list) -> numpy.ndarray:
+        """ Pick level of first matching condition for every pad, None levels are deactive and pads without any match get nan """
+        level = numpy.full(shape, numpy.nan)
+        for condition, value in zip(reversed(conditions), reversed(levels)):
+            if value is None:
+                value = -1.0
+            elif isinstance(value, numpy.ndarray):
+                value = numpy.maximum(value, 0.0)
+            level = numpy.where(condition, value, level)
+        return level
+
+    def _shade(self, level: numpy.ndarray, previous: numpy.ndarray) -> numpy.ndarray:
+        """
+        Description
+        ----
+        Packed pixels from pad levels calculated by vectorized renderers.
+
+        Parameters
+        ----
+        level: numpy.ndarray
+            Non-negative levels scale activeColor,
+            negative levels use deactiveColor,
+            nan keeps previous pixel
+        previous: numpy.ndarray
+            Packed pixels currently in buffer
+        """
+        lit = level >= 0.0
+        # same truncation as Pixel multiplication, alpha of activeColor is kept
+        channels = numpy.where(lit, level, 0.0)[..., None] * numpy.array(self.activeColor.color, dtype = numpy.float64)
+        channels = numpy.minimum(channels, 255.0).astype(numpy.uint32).dot(Widget._channelShifts)
+        active = channels | numpy.uint32(self.activeColor.value & 0xFF000000)
+        return numpy.where(lit, active, numpy.where(level < 0.0, numpy.uint32(self.deactiveColor.value), previous)).astype(numpy.uint32)
+
+    _channelShifts = numpy.array([1 << 16, 1 << 8, 1], dtype = numpy.uint32)
+
+    @staticmethod
+    def _tiles(width: int, height: int, tileWidth: int, tileHeight: int) -> tuple:
+        """
+        Description
+        ----
+        Split widget into equal tiles, used by bank widgets.
+        Tiles are numbered left to right, bottom to top.
+
+        Returns
+        ----
+        slots: numpy.ndarray
+            Tile number of every pad, -1 for pads outside of whole tiles
+        localX: numpy.ndarray
+            x of every pad inside its tile
+        localY: numpy.ndarray
+            y of every pad inside its tile
+        count: int
+            Number of tiles
+        """
+        columns = width // tileWidth
+        rows = height // tileHeight
+        x = numpy.arange(width)[:, None]
+        y = numpy.arange(height)[None, :]
+        inside = (x < (columns * tileWidth)) & (y < (rows * tileHeight))
+        slots = numpy.where(inside, (x // tileWidth) + ((y // tileHeight) * columns), -1)
+        localX, localY = numpy.broadcast_arrays(x % tileWidth, y % tileHeight)
+        return slots, localX, localY, columns * rows
+
 # Button class
 class Button(Widget):
     class Mode(enum.Enum):
@@ -339,7 +513,7 @@ class ButtonGroup(Widget):
             intersect = self.rect.intersect(rect)
             if intersect is not None:
                 area = intersect - self.rect
-                self.buffer[area.slice] = numpy.where(self.state[area.slice] == True, self.activeColor, self.deactiveColor)
+                self.buffer[area.slice] = PyxelWidgets.Utils.Pixel.PixelBuffer.where(self.state[area.slice], self.activeColor, self.deactiveColor)
                 return intersect, self.buffer[area.slice]
         return None, None
 
@@ -468,11 +642,11 @@ class Fader(Widget):
     def _pressedSimple(self, x, y, value):
         if self.type == Fader.Type.BoostCut:
             if self._minV[x][y] < 0.5:
-                return self._minV[x][y]
+                return float(self._minV[x][y])
             else:
-                return self._maxV[x][y]
+                return float(self._maxV[x][y])
         else:
-            return self._minV[x][y]
+            return float(self._minV[x][y])
 
     def _pressedMulti(self, x, y, value):
         if self.type == Fader.Type.BoostCut:
@@ -530,7 +704,7 @@ class Fader(Widget):
         if self.mode != Fader.Mode.Relative:
             if x == 0 and y == 0:
                 self.setValue(0.0)
-            elif x == self.rect.w - 1 and y == self.rect.h - 1:
+            elif x == self._area.w - 1 and y == self._area.h - 1:
                 self.setValue(1.0)
             else:
                 self.setValue(0.5)
@@ -543,137 +717,72 @@ class Fader(Widget):
     def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D):
         if self.updated:
             self.updated = False
-            halfval = self._value / 2.0
-            halfvalpluspointfive = halfval + 0.5
             intersect = self.rect.intersect(rect)
             if intersect is not None:
                 area = intersect - self.rect
-                for x in area.columns:
-                    for y in area.rows:
-                        minV = self._minV[x][y]
-                        maxV = self._maxV[x][y]
-                        if self.type == Fader.Type.Single:
-                            # if current pad lower than last pressed pad
-                            if maxV <= self._value:
-                                self.buffer[x, y] = self.deactiveColor
-                            # if current pad higher than last pressed pad
-                            elif minV > self._value:
-                                self.buffer[x, y] = self.deactiveColor
-                            # if current pad is last pressed pad
-                            else:
-                                coefficient = min(self._calcPixelCoefficient(self._value - minV) + self._calcPixelStep(), 1.0)
-                                self.buffer[x, y] = self.activeColor * coefficient
-                        elif self.type == Fader.Type.BoostCut:
-                            # if last pressed pad in upper half
-                            if self._value > 0.5:
-                                # if current pad in lower half
-                                if minV < 0.5:
-                                    self.buffer[x, y] = self.deactiveColor
-                                # if current pad in upper half
-                                else:
-                                    # if current pad is lower than last pressed pad
-                                    if maxV <= self._value:
-                                        self.buffer[x, y] = self.activeColor
-                                    # if current pad is higher than last pressed pad
-                                    elif minV > self._value:
-                                        self.buffer[x, y] = self.deactiveColor
-                                    # if current pad is last pressed pad
-                                    else:
-                                        coefficient = min(self._calcPixelCoefficient(self._value - minV) + self._calcPixelStep(), 1.0)
-                                        self.buffer[x, y] = self.activeColor * coefficient
-                            # if last pressed pad in lower half
-                            elif self._value < 0.5:
-                                # if current pad in upper half
-                                if maxV > 0.5:
-                                    self.buffer[x, y] = self.deactiveColor
-                                # if current pad in lower half
-                                else:
-                                    # if current pad is higher than last pressed pad
-                                    if minV >= self._value:
-                                        self.buffer[x, y] = self.activeColor
-                                    # if current pad is lower than last pressed pad
-                                    elif maxV < self._value:
-                                        self.buffer[x, y] = self.deactiveColor
-                                    # if current pad is last pressed pad
-                                    else:
-                                        # reverse brightness to match type
-                                        coefficient = 1.0 - self._calcPixelCoefficient(self._value - minV)
-                                        self.buffer[x, y] = self.activeColor * coefficient
-                            # if current value is 0.5
-                            else:
-                                # lit middle pad(s)
-                                if minV == 0.5 or maxV == 0.5:
-                                    self.buffer[x, y] = self.activeColor
-                                # unlit every other pad
-                                else:
-                                    self.buffer[x, y] = self.deactiveColor
-                        elif self.type == Fader.Type.Wrap:
-                            # if current pad lower than last pressed pad
-                            if maxV <= self._value:
-                                self.buffer[x, y] = self.activeColor
-                            # if current pad higher than last pressed pad
-                            elif minV > self._value:
-                                self.buffer[x, y] = self.deactiveColor
-                            # if current pad is last pressed pad
-                            else:
-                                coefficient = min(self._calcPixelCoefficient(self._value - minV) + self._calcPixelStep(), 1.0)
-                                self.buffer[x, y] = self.activeColor * coefficient
-                        elif self.type == Fader.Type.Spread:
-                            # if current pad in upper half
-                            if minV >= 0.5:
-                                # if current pad higher than current value
-                                if minV > halfvalpluspointfive:
-                                    self.buffer[x, y] = self.deactiveColor
-                                # if current pad lower than current value
-                                elif maxV <= halfvalpluspointfive:
-                                    self.buffer[x, y] = self.activeColor
-                                # if current value is in current pad's boundary
-                                else:
-                                    coefficient = self._calcPixelCoefficient(halfvalpluspointfive - minV)
-                                    self.buffer[x, y] = self.activeColor * coefficient
-                            # if current pad in lower half
-                            elif maxV <= 0.5:
-                                # if current pad higher than current value
-                                if minV >= (1.0 - halfvalpluspointfive):
-                                    self.buffer[x, y] = self.activeColor
-                                # if current pad lower than current value
-                                elif maxV < (1.0 - halfvalpluspointfive):
-                                    self.buffer[x, y] = self.deactiveColor
-                                # if current value is in current pad's boundary
-                                else:
-                                    coefficient = 1.0 - self._calcPixelCoefficient((1.0 - halfvalpluspointfive) - minV)
-                                    self.buffer[x, y] = self.activeColor * coefficient
-                        elif self.type == Fader.Type.Collapse:
-                            # if current pad in upper half
-                            if minV >= 0.5:
-                                # if current pad lower than current value
-                                if minV >= (1.0 - halfval):
-                                    self.buffer[x, y] = self.deactiveColor
-                                # if current pad higher than current value
-                                elif maxV < (1.0 - halfval):
-                                    self.buffer[x, y] = self.activeColor
-                                # if current value is in current pad's boundary
-                                else:
-                                    coefficient = self._calcPixelCoefficient((1.0 - halfval) - minV)
-                                    self.buffer[x, y] = self.activeColor * coefficient
-                            # if current pad in lower half
-                            elif maxV <= 0.5:
-                                # if current pad lower than current value
-                                if minV > halfval:
-                                    self.buffer[x, y] = self.activeColor
-                                # if current pad higher than current value
-                                elif maxV <= halfval:
-                                    self.buffer[x, y] = self.deactiveColor
-                                # if current value is in current pad's boundary
-                                else:
-                                    coefficient = 1.0 - self._calcPixelCoefficient(halfval - minV)
-                                    self.buffer[x, y] = self.activeColor * coefficient
+                if not self._restoreFrame(area):
+                    level = self._calcPixelLevels(self._renderValue(), self._minV[area.slice], self._maxV[area.slice])
+                    self.buffer.data[area.slice] = self._shade(level, self.buffer.data[area.slice])
+                    self._storeFrame(area)
                 return intersect, self.buffer[area.slice]
         return None, None
 
+    def _renderConfig(self) -> tuple:
+        return (self.type, self.direction, self.grid, self.mode, self.resolution)
+
+    def _calcPixelLevels(self, value: float, minV: numpy.ndarray, maxV: numpy.ndarray) -> numpy.ndarray:
+        """
+        Calculate pad levels of every pad at once, see Widget._shade.
+        Conditions are checked in order, first matching one sets level.
+        """
+        halfval = value / 2.0
+        halfvalpluspointfive = halfval + 0.5
+        step = self._calcPixelStep()
+        dark = None
+        if self.type == Fader.Type.Single:
+            # lower or higher than last pressed pad, otherwise last pressed pad
+            conditions = [maxV <= value, minV > value, True]
+            levels = [dark, dark, numpy.minimum(self._calcPixelCoefficient(value - minV) + step, 1.0)]
+        elif self.type == Fader.Type.BoostCut:
+            # branches are masks so value could be a per pad array (banks)
+            boost = value > 0.5
+            cut = value < 0.5
+            # boost: lower half, lower than value, higher than value, last pressed pad
+            # cut: upper half, higher than value, lower than value, last pressed pad with reversed brightness
+            # otherwise lit middle pad(s)
+            conditions = [boost & (minV < 0.5), boost & (maxV <= value), boost & (minV > value), boost,
+                          cut & (maxV > 0.5), cut & (minV >= value), cut & (maxV < value), cut,
+                          (minV == 0.5) | (maxV == 0.5), True]
+            levels = [dark, 1.0, dark, numpy.minimum(self._calcPixelCoefficient(value - minV) + step, 1.0),
+                      dark, 1.0, dark, 1.0 - self._calcPixelCoefficient(value - minV),
+                      1.0, dark]
+        elif self.type == Fader.Type.Wrap:
+            conditions = [maxV <= value, minV > value, True]
+            levels = [1.0, dark, numpy.minimum(self._calcPixelCoefficient(value - minV) + step, 1.0)]
+        elif self.type == Fader.Type.Spread:
+            upper = minV >= 0.5
+            lower = maxV <= 0.5
+            conditions = [upper & (minV > halfvalpluspointfive), upper & (maxV <= halfvalpluspointfive), upper,
+                          lower & (minV >= (1.0 - halfvalpluspointfive)), lower & (maxV < (1.0 - halfvalpluspointfive)), lower]
+            levels = [dark, 1.0, self._calcPixelCoefficient(halfvalpluspointfive - minV),
+                      1.0, dark, 1.0 - self._calcPixelCoefficient((1.0 - halfvalpluspointfive) - minV)]
+        elif self.type == Fader.Type.Collapse:
+            upper = minV >= 0.5
+            lower = maxV <= 0.5
+            conditions = [upper & (minV >= (1.0 - halfval)), upper & (maxV < (1.0 - halfval)), upper,
+                          lower & (minV > halfval), lower & (maxV <= halfval), lower]
+            levels = [dark, 1.0, self._calcPixelCoefficient((1.0 - halfval) - minV),
+                      1.0, dark, 1.0 - self._calcPixelCoefficient(halfval - minV)]
+        return Widget._levels(minV.shape, conditions, levels)
+
+    @property
+    def _area(self) -> PyxelWidgets.Utils.Rectangle.Rectangle2D:
+        """ Rectangle of one fader, value and brightness calculations are relative to it """
+        return self.rect
+
     def _resize(self, width, height):
-        self._minV = [[self._calcFaderValue(x, y, 0.0) for y in range(height)] for x in range(width)]
-        self._maxV = [[self._calcFaderValue(x, y, 1.0) for y in range(height)] for x in range(width)]
+        self._minV = numpy.array([[self._calcFaderValue(x, y, 0.0, width, height) for y in range(height)] for x in range(width)], dtype = numpy.float64)
+        self._maxV = numpy.array([[self._calcFaderValue(x, y, 1.0, width, height) for y in range(height)] for x in range(width)], dtype = numpy.float64)
         return True
 
     """
@@ -685,43 +794,46 @@ class Fader(Widget):
         Horizontal matrix faders are bottom to up, left to right in order.
         Simple faders are bottom to up for vertical, left to right for horizontal.
     """
-    def _calcFaderValue(self, x: int, y: int, value: float) -> float:
+    def _calcFaderValue(self, x: int, y: int, value: float, width: int = None, height: int = None) -> float:
         """Calculate fader value from pad location"""
+        # _resize runs before rect gets the new size, so it passes the size itself
+        width = self._area.w if width is None else width
+        height = self._area.h if height is None else height
         if self.grid == Fader.Grid.Simple:
             if self.direction == Fader.Direction.Vertical:
-                return round(((y / self.rect.h) + (value / self.rect.h)), 6)
+                return round(((y / height) + (value / height)), 6)
             elif self.direction == Fader.Direction.Horizontal:
-                return round(((x / self.rect.w) + (value / self.rect.w)), 6)
+                return round(((x / width) + (value / width)), 6)
         elif self.grid == Fader.Grid.Matrix:
             if self.direction == Fader.Direction.Vertical:
-                base = (x / self.rect.area) + (y / self.rect.h)
+                base = (x / (width * height)) + (y / height)
             elif self.direction == Fader.Direction.Horizontal:
-                base = (y / self.rect.area) + (x / self.rect.w)
-            return round(base + (value / self.rect.area), 6)
+                base = (y / (width * height)) + (x / width)
+            return round(base + (value / (width * height)), 6)
     
     def _calcFaderMagnitude(self, x: int, y: int) -> float:
         """Calculate pad magnitude from pad location"""
         if self.grid == Fader.Grid.Simple:
             if self.direction == Fader.Direction.Vertical:
-                return self._calcFaderValue(x, y, y / (self.rect.h - 1))
+                return self._calcFaderValue(x, y, y / (self._area.h - 1))
             elif self.direction == Fader.Direction.Horizontal:
-                return self._calcFaderValue(x, y, x / (self.rect.w - 1))
+                return self._calcFaderValue(x, y, x / (self._area.w - 1))
         elif self.grid == Fader.Grid.Matrix:
             if self.direction == Fader.Direction.Vertical:
-                base = (x / (self.rect.area - 1)) + (y / (self.rect.h - 1))
+                base = (x / (self._area.area - 1)) + (y / (self._area.h - 1))
             elif self.direction == Fader.Direction.Horizontal:
-                base = (y / (self.rect.area - 1)) + (x / (self.rect.w - 1))
+                base = (y / (self._area.area - 1)) + (x / (self._area.w - 1))
             return self._calcFaderValue(x, y, base)
     
     def _calcPixelCoefficient(self, value: float) -> float:
         """Calculate pixel coefficient for different fader options"""
         if self.grid == Fader.Grid.Simple:
             if self.direction == Fader.Direction.Vertical:
-                return (value * self.rect.h)
+                return (value * self._area.h)
             elif self.direction == Fader.Direction.Horizontal:
-                return (value * self.rect.w)
+                return (value * self._area.w)
         elif self.grid == Fader.Grid.Matrix:
-            return (value * self.rect.area)
+            return (value * self._area.area)
     
     def _calcPixelStep(self):
         if self.mode == Fader.Mode.Simple:
@@ -735,11 +847,189 @@ class Fader(Widget):
         elif self.mode == Fader.Mode.Relative:
             if self.grid == Fader.Grid.Simple:
                 if self.direction == Fader.Direction.Vertical:
-                    return 1.0/ self.rect.h
+                    return 1.0/ self._area.h
                 elif self.direction == Fader.Direction.Horizontal:
-                    return 1.0 / self.rect.w
+                    return 1.0 / self._area.w
             elif self.grid == Fader.Grid.Matrix:
-                return 1.0 / self.rect.area
+                return 1.0 / self._area.area
+
+# Bank class
+class Bank():
+    """
+    Description
+    ----
+    Channel handling shared by bank widgets.
+    Bank widgets split their area into equal tiles, every tile shows one
+     channel, values of every channel are kept in values array and all
+      visible channels are rendered together. Changes are collected and
+       sent with a single Changed event at next update, event value is
+        (channels, values) arrays.
+    Channels are paged, page 0 shows first channels which fit in widget.
+    """
+    def _initBank(self, channels: int, values = None) -> None:
+        self.channels = channels
+        self.values = numpy.zeros(channels, dtype = numpy.float64)
+        if values is not None:
+            self.values[:] = numpy.round(numpy.clip(values, 0.0, 1.0), 6)
+        self.slotCount = 1
+        self._offset = 0
+        self._channel = 0
+        self._pending = {}
+
+    @property
+    def value(self) -> float:
+        """ Value of last touched channel """
+        return float(self.values[self._channel])
+
+    @value.setter
+    def value(self, value: float) -> None:
+        self.setChannel(self._channel, value)
+
+    def setValue(self, value: float):
+        self.setChannel(self._channel, value)
+
+    def setChannel(self, channel: int, value: float) -> None:
+        value = round(min(1.0, max(0.0, value)), 6)
+        if not self.lock:
+            self.values[channel] = value
+        self._pending[channel] = value
+        self.updated = True
+
+    def setValues(self, values, channels = None, notify: bool = True) -> None:
+        """ Set values of many channels at once, every channel if channels is None, without Changed event if notify is False """
+        channels = numpy.arange(self.channels) if channels is None else numpy.asarray(channels, dtype = numpy.intp).reshape(-1)
+        values = numpy.round(numpy.clip(numpy.broadcast_to(numpy.asarray(values, dtype = numpy.float64), channels.shape), 0.0, 1.0), 6)
+        if not notify:
+            # values coming from outside replace changes not sent yet
+            for channel in channels.tolist():
+                self._pending.pop(channel, None)
+        changed = self.values[channels] != values
+        if changed.any():
+            # lock only stops pad input, values set from outside are always applied
+            self.values[channels[changed]] = values[changed]
+            if notify:
+                self._pending.update(zip(channels[changed].tolist(), values[changed].tolist()))
+            self.updated = True
+
+    @property
+    def pages(self) -> int:
+        return max(1, -(-self.channels // max(1, self.slotCount)))
+
+    @property
+    def page(self) -> int:
+        return self._offset // max(1, self.slotCount)
+
+    @page.setter
+    def page(self, value: int) -> None:
+        self._offset = (value % self.pages) * self.slotCount
+        self.updated = True
+
+    def _layoutBank(self, width: int, height: int, tileWidth: int, tileHeight: int) -> None:
+        self._slots, self._localX, self._localY, self.slotCount = Widget._tiles(width, height, tileWidth, tileHeight)
+        self._offset = (self._offset // max(1, self.slotCount)) * self.slotCount
+
+    def _locate(self, x: int, y: int) -> tuple:
+        """ Channel and tile coordinates of pad, channel is -1 if pad shows no channel """
+        slot = self._slots[x, y]
+        channel = self._offset + slot
+        if slot < 0 or channel >= self.channels:
+            return -1, x, y
+        return int(channel), int(self._localX[x, y]), int(self._localY[x, y])
+
+    def _visibleValues(self, area: PyxelWidgets.Utils.Rectangle.Rectangle2D) -> tuple:
+        """ Value of channel shown on every pad and mask of pads showing a channel """
+        slots = self._slots[area.slice]
+        channels = self._offset + slots
+        visible = (slots >= 0) & (channels < self.channels)
+        return self.values[numpy.where(visible, channels, 0)], visible
+
+    def _flushChanges(self) -> None:
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Changed, (numpy.fromiter(pending.keys(), dtype = numpy.intp, count = len(pending)), numpy.fromiter(pending.values(), dtype = numpy.float64, count = len(pending))))
+
+# FaderBank class
+class FaderBank(Bank, Fader):
+    """
+    Description
+    ----
+    Many faders in one widget, see Bank.
+    Vertical faders are placed left to right, horizontal faders bottom to
+     top, every fader is channelSize pads thick. Type, grid, mode and
+      resolution are shared by every fader.
+
+    Parameters
+    ----
+    channels: int = faders fitting in widget
+        Number of channels
+    channelSize: int = 1
+        Width of vertical or height of horizontal faders
+    values: list = None
+        Initial channel values
+    """
+
+    _count = 0
+
+    def __init__(self, x: int, y: int, width: int, height: int, **kwargs):
+        kwargs['name'] = kwargs.get('name', f'FaderBank_{FaderBank._count}')
+        self.channelSize = kwargs.get('channelSize', 1)
+        vertical = kwargs.get('direction', Fader.Direction.Vertical) == Fader.Direction.Vertical
+        self._initBank(kwargs.get('channels', (width if vertical else height) // self.channelSize), kwargs.get('values', None))
+        self._tileSize = (1, 1)
+        super().__init__(x, y, width, height, **kwargs)
+        FaderBank._count += 1
+
+    def press(self, x: int, y: int, value: float):
+        channel, x, y = self._locate(x, y)
+        if channel != -1:
+            if channel != self._channel:
+                self._channel = channel
+                self._oldButton = [-1, -1]
+                self._heldButton = [-1, -1]
+            super().press(x, y, value)
+
+    def hold(self, x: int, y: int, value: float):
+        channel, x, y = self._locate(x, y)
+        if channel != -1:
+            self._channel = channel
+            super().hold(x, y, value)
+
+    def release(self, x: int, y: int, value: float):
+        channel, x, y = self._locate(x, y)
+        if channel == self._channel:
+            super().release(x, y, value)
+
+    def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D):
+        if self.updated:
+            self.updated = False
+            self._flushChanges()
+            intersect = self.rect.intersect(rect)
+            if intersect is not None:
+                area = intersect - self.rect
+                previous = self.buffer.data[area.slice].copy()
+                values, visible = self._visibleValues(area)
+                level = self._calcPixelLevels(values, self._bankMinV[area.slice], self._bankMaxV[area.slice])
+                pixels = self._shade(level, previous)
+                pixels[~visible] = PyxelWidgets.Utils.Pixel.Colors.Invisible.value
+                self.buffer.data[area.slice] = pixels
+                return intersect, self.buffer[area.slice], pixels != previous
+        return None, None
+
+    @property
+    def _area(self) -> PyxelWidgets.Utils.Rectangle.Rectangle2D:
+        return PyxelWidgets.Utils.Rectangle.Rectangle2D(0, 0, self._tileSize[0], self._tileSize[1])
+
+    def _resize(self, width, height):
+        if self.direction == Fader.Direction.Vertical:
+            self._tileSize = (self.channelSize, height)
+        else:
+            self._tileSize = (width, self.channelSize)
+        # tables of a single fader, pads of every tile share them
+        super()._resize(*self._tileSize)
+        self._layoutBank(width, height, *self._tileSize)
+        self._bankMinV = self._minV[self._localX, self._localY]
+        self._bankMaxV = self._maxV[self._localX, self._localY]
+        return True
 
 # Keyboard class
 class Keyboard(Widget):
@@ -904,15 +1194,13 @@ class Keyboard(Widget):
 
     def press(self, x: int, y: int, value: float):
         if self.notes[x, y] >= 0:
-            for button in self.buttons[self.notes[x, y]]:
-                self.states[button[0], button[1]] = True
+            self.states[self.notes == self.notes[x, y]] = True
         self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Changed, (self.notes[x, y], 1.0))
         self.updated = True
     
     def release(self, x: int, y: int, value: float):
         if self.notes[x, y] >= 0:
-            for button in self.buttons[self.notes[x, y]]:
-                self.states[button[0], button[1]] = False
+            self.states[self.notes == self.notes[x, y]] = False
         self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Changed, (self.notes[x, y], 0.0))
         self.updated = True
     
@@ -922,73 +1210,91 @@ class Keyboard(Widget):
             intersect = self.rect.intersect(rect)
             if intersect is not None:
                 area = intersect - self.rect
-                for x in area.columns:
-                    for y in area.rows:
-                        note = self.notes[x, y]
-                        if note >= 0:
-                            if self.states[x, y]:
-                                self.buffer[x, y] = self.activeColor
-                            else:
-                                self.buffer[x, y] = self.colors[note]
-                        else:
-                            self.buffer[x, y] = self.deactiveColor
-                return intersect, self.buffer[area.slice]
+                previous = self.buffer[area.slice].copy()
+                self._colorTable[-1] = self.deactiveColor.value
+                pixels = self._colorTable[self.notes[area.slice]]
+                self.buffer.data[area.slice] = numpy.where(self.states[area.slice], numpy.uint32(self.activeColor.value), pixels)
+                return intersect, self.buffer[area.slice], self.buffer[area.slice] != previous
         return None, None
 
     def _resize(self, width, height) -> bool:
-        self.notes = numpy.array([[0 for y in range(height)] for x in range(width)])
-        self.states = numpy.array([[0 for y in range(height)] for x in range(width)])
-        self.colors = [PyxelWidgets.Utils.Pixel.Colors.Invisible for i in range(128)]
-        self.buttons = [[] for i in range(128)]
-        self._calcNotes()
-
-    def _calcNotes(self):
-        base = self._root.value + (self._octave * 12)
-        scale = Keyboard.Scales[self._scale.name]
-        precalc = []
-        #precalculate scale values
-        for i in range(self.rect.area):
-            precalc.append(scale[i % len(scale)] + base + ((i // len(scale)) * 12))
-        for x in range(self.rect.w):
-            for y in range(self.rect.h):
-                #calculate notes
-                if self._type == Keyboard.Type.Keyboard:
-                    base = Keyboard.Root.C.value + (self._octave * 12)
-                    length = 7 if 7 < self.rect.w else self.rect.w
-                    if y % 2 == 0:
-                        scale = Keyboard.Scales['Keyboard']
-                    else:
-                        scale = Keyboard.Scales['KeyboardUpper']
-                    if scale[x % length] == -1:
-                        self.notes[x, y] = -1
-                    else:
-                        self.notes[x, y] = scale[x % length] + base + ((y // 2) * 12) + ((x // length) * 12)
-                elif self._type == Keyboard.Type.ChromaticVertical:
-                    index = x + (y * (self._fold - 1))
-                    self.notes[x, y] = index + base
-                elif self._type == Keyboard.Type.ChromaticHorizontal:
-                    index = y + (x * (self._fold - 1))
-                    self.notes[x, y] = index + base
-                elif self._type == Keyboard.Type.Diatonic:
-                    self.notes[x, y] = precalc[x + (y * len(scale))]
-                elif self._type == Keyboard.Type.DiatonicVertical:
-                    self.notes[x, y] = precalc[x + (y * len(scale)) - (y * (len(scale) - self._fold + 1))]
-                elif self._type == Keyboard.Type.DiatonicHorizontal:
-                    self.notes[x, y] = precalc[y + (x * len(scale)) - (x * (len(scale) - self._fold + 1))]
-                #clear notes 128 or higher
-                if self.notes[x, y] > 127:
-                    self.notes[x, y] = -1
-                #make array from same buttons
-                if self.notes[x, y] != -1:
-                    self.buttons[self.notes[x, y]].append([x, y])
-                #change colors
-                if self.notes[x, y] != -1:
-                    if (self.notes[x, y] - self._root.value) % 12 == 0:
-                        self.colors[self.notes[x, y]] = self._rootColor
-                    elif (self.notes[x, y] - self._root.value) % 12 in Keyboard.Scales[self._scale.name]:
-                        self.colors[self.notes[x, y]] = self._keyboardColor
-                    else:
-                        self.colors[self.notes[x, y]] = self._nonScaleColor
+        self.notes, kinds, self.buttons = Keyboard._layout(self._type, self._scale, self._root, self._octave, self._fold, width, height)
+        self.states = numpy.zeros((width, height), dtype = numpy.bool_)
+        # unused notes (kind -1) pick the last, invisible palette entry
+        palette = numpy.array([self._rootColor.value, self._keyboardColor.value, self._nonScaleColor.value, PyxelWidgets.Utils.Pixel.Colors.Invisible.value], dtype = numpy.uint32)
+        # 128 note colors and a sentinel slot for pads without note, notes of -1 index the sentinel
+        self._colorTable = numpy.append(palette[kinds], numpy.uint32(self.deactiveColor.value))
+        self.colors = [PyxelWidgets.Utils.Pixel.Pixel.fromValue(value) for value in self._colorTable[:128].tolist()]
+        return True
+
+    layoutCacheSize = 64
+    _layouts = collections.OrderedDict()
+
+    @staticmethod
+    def _layout(type: Type, scale: Scale, root: Root, octave: int, fold: int, width: int, height: int) -> tuple:
+        """
+        Description
+        ----
+        Note layout of a keyboard, shared between keyboards and cached
+        in a least recently used cache, layouts must not be modified.
+
+        Returns
+        ----
+        notes: numpy.ndarray
+            (width, height) notes, -1 for pads without note
+        kinds: numpy.ndarray
+            128 entries, 0 for root, 1 for scale and 2 for non scale notes, -1 for unused notes
+        buttons: list
+            128 entries, [x, y] pads of every note
+        """
+        key = (type, scale, root, octave, fold, width, height)
+        layout = Keyboard._layouts.get(key)
+        if layout is not None:
+            Keyboard._layouts.move_to_end(key)
+            return layout
+        notes = Keyboard._calcNotes(type, scale, root, octave, fold, width, height)
+        notes.flags.writeable = False
+        used = notes >= 0
+        offsets = (notes[used] - root.value) % 12
+        kinds = numpy.full(128, -1, dtype = numpy.int8)
+        kinds[notes[used]] = numpy.where(offsets == 0, 0, numpy.where(numpy.isin(offsets, Keyboard.Scales[scale.name]), 1, 2))
+        kinds.flags.writeable = False
+        buttons = [[] for i in range(128)]
+        for x, y in zip(*numpy.nonzero(used)):
+            buttons[notes[x, y]].append([int(x), int(y)])
+        layout = (notes, kinds, buttons)
+        Keyboard._layouts[key] = layout
+        if len(Keyboard._layouts) > Keyboard.layoutCacheSize:
+            Keyboard._layouts.popitem(last = False)
+        return layout
+
+    @staticmethod
+    def _calcNotes(type: Type, scale: Scale, root: Root, octave: int, fold: int, width: int, height: int) -> numpy.ndarray:
+        x, y = numpy.meshgrid(numpy.arange(width), numpy.arange(height), indexing = 'ij')
+        base = root.value + (octave * 12)
+        steps = numpy.array(Keyboard.Scales[scale.name])
+        length = len(steps)
+        #calculate notes
+        if type == Keyboard.Type.Keyboard:
+            length = 7 if 7 < width else width
+            keys = numpy.where((y % 2) == 0, numpy.array(Keyboard.Scales['Keyboard'])[x % length], numpy.array(Keyboard.Scales['KeyboardUpper'])[x % length])
+            base = Keyboard.Root.C.value + (octave * 12)
+            notes = numpy.where(keys == -1, -1, keys + base + ((y // 2) * 12) + ((x // length) * 12))
+        elif type == Keyboard.Type.ChromaticVertical:
+            notes = x + (y * (fold - 1)) + base
+        elif type == Keyboard.Type.ChromaticHorizontal:
+            notes = y + (x * (fold - 1)) + base
+        else:
+            if type == Keyboard.Type.Diatonic:
+                index = x + (y * length)
+            elif type == Keyboard.Type.DiatonicVertical:
+                index = x + (y * length) - (y * (length - fold + 1))
+            elif type == Keyboard.Type.DiatonicHorizontal:
+                index = y + (x * length) - (x * (length - fold + 1))
+            notes = steps[index % length] + base + ((index // length) * 12)
+        #clear notes 128 or higher
+        notes = numpy.where(notes > 127, -1, notes)
+        return notes
 
 # Knob class
 class Knob(Widget):
@@ -1030,9 +1336,9 @@ class Knob(Widget):
     
     def tick(self):
         if self.state:
-            index = self._calcKnobIndex(self._held[0], self._held[1])
+            index = self.indexes[self._held[0], self._held[1]]
             if index != -1:
-                self.setValue(self._value + (self._calcKnobWeight(index) * self.coefficient))
+                self.setValue(self.value + (self._calcKnobWeight(index) * self.coefficient))
 
     def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D):
         if self.updated:
@@ -1040,117 +1346,89 @@ class Knob(Widget):
                 self.updated = False
             else:
                 self.tick()
-            halfval = self._value / 2.0
-            halfvalpluspointfive = halfval + 0.5
             intersect = self.rect.intersect(rect)
             if intersect is not None:
                 area = intersect - self.rect
-                for x in area.columns:
-                    for y in area.rows:
-                        index = self.indexes[x][y]
-                        minV = self._minV[index]
-                        maxV = self._maxV[index]
-                        if index == -1:
-                            self.buffer[x, y] = PyxelWidgets.Utils.Pixel.Colors.Invisible
-                        else:
-                            if self.type == Knob.Type.Single:
-                                if maxV < self._value:
-                                    self.buffer[x, y] = self.deactiveColor
-                                elif minV > self._value:
-                                    self.buffer[x, y] = self.deactiveColor
-                                else:
-                                    coefficient = self._calcPixelCoefficient(self._value - minV)
-                                    self.buffer[x, y] = self.activeColor * coefficient
-                            elif self.type == Knob.Type.BoostCut:
-                                if self._value > 0.5:
-                                    if minV < 0.5:
-                                        self.buffer[x, y] = self.deactiveColor
-                                    else:
-                                        if maxV <= self._value:
-                                            self.buffer[x, y] = self.activeColor
-                                        elif minV > self._value:
-                                            self.buffer[x, y] = self.deactiveColor
-                                        else:
-                                            coefficient = self._calcPixelCoefficient(self._value - minV)
-                                            self.buffer[x, y] = self.activeColor * coefficient
-                                elif self._value < 0.5:
-                                    if maxV > 0.5:
-                                        self.buffer[x, y] = self.deactiveColor
-                                    else:
-                                        if minV >= self._value:
-                                            self.buffer[x, y] = self.activeColor
-                                        elif maxV < self._value:
-                                            self.buffer[x, y] = self.deactiveColor
-                                        else:
-                                            coefficient = 1.0 - self._calcPixelCoefficient(self._value - minV)
-                                            self.buffer[x, y] = self.activeColor * coefficient
-                                else:
-                                    if minV == 0.5 or maxV == 0.5:
-                                        self.buffer[x, y] = self.activeColor
-                                    else:
-                                        self.buffer[x, y] = self.deactiveColor
-                            elif self.type == Knob.Type.Wrap:
-                                if maxV <= self._value:
-                                    self.buffer[x, y] = self.activeColor
-                                elif minV > self._value:
-                                    self.buffer[x, y] = self.deactiveColor
-                                else:
-                                    coefficient = self._calcPixelCoefficient(self._value - minV)
-                                    self.buffer[x, y] = self.activeColor * coefficient
-                            elif self.type == Knob.Type.Spread:
-                                if minV >= 0.5:
-                                    if minV > halfvalpluspointfive:
-                                        self.buffer[x, y] = self.deactiveColor
-                                    elif maxV <= halfvalpluspointfive:
-                                        self.buffer[x, y] = self.activeColor
-                                    else:
-                                        coefficient = self._calcPixelCoefficient(halfvalpluspointfive - minV)
-                                        self.buffer[x, y] = self.activeColor * coefficient
-                                elif maxV <= 0.5:
-                                    if minV >= (1.0 - halfvalpluspointfive):
-                                        self.buffer[x, y] = self.activeColor
-                                    elif maxV < (1.0 - halfvalpluspointfive):
-                                        self.buffer[x, y] = self.deactiveColor
-                                    else:
-                                        coefficient = 1.0 - self._calcPixelCoefficient((1.0 - halfvalpluspointfive) - minV)
-                                        self.buffer[x, y] = self.activeColor * coefficient
-                            elif self.type == Knob.Type.Collapse:
-                                if halfval < 0.5:
-                                    if maxV <= 0.5:
-                                        if minV > halfval:
-                                            self.buffer[x, y] = self.activeColor
-                                        elif maxV <= halfval:
-                                            self.buffer[x, y] = self.deactiveColor
-                                        else:
-                                            coefficient = 1.0 - self._calcPixelCoefficient(halfval - minV)
-                                            self.buffer[x, y] = self.activeColor * coefficient
-                                    elif minV >= 0.5:
-                                        if minV >= (1.0 - halfval):
-                                            self.buffer[x, y] = self.deactiveColor
-                                        elif maxV < (1.0 - halfval):
-                                            self.buffer[x, y] = self.activeColor
-                                        else:
-                                            coefficient = self._calcPixelCoefficient((1.0 - halfval) - minV)
-                                            self.buffer[x, y] = self.activeColor * coefficient
-                                else:
-                                    self.buffer[x, y] = self.deactiveColor
-            return intersect, self.buffer[area.slice]
+                if not self._restoreFrame(area):
+                    level = self._calcPixelLevels(self._renderValue(), self._cellMinV[area.slice], self._cellMaxV[area.slice])
+                    pixels = self._shade(level, self.buffer.data[area.slice])
+                    pixels[~self._ring[area.slice]] = PyxelWidgets.Utils.Pixel.Colors.Invisible.value
+                    self.buffer.data[area.slice] = pixels
+                    self._storeFrame(area)
+                return intersect, self.buffer[area.slice]
         return None, None
+
+    def _renderConfig(self) -> tuple:
+        return (self.type, )
+
+    def _calcPixelLevels(self, value: float, minV: numpy.ndarray, maxV: numpy.ndarray) -> numpy.ndarray:
+        """
+        Calculate pad levels of every pad at once, see Widget._shade.
+        Conditions are checked in order, first matching one sets level.
+        """
+        halfval = value / 2.0
+        halfvalpluspointfive = halfval + 0.5
+        dark = None
+        if self.type == Knob.Type.Single:
+            conditions = [maxV < value, minV > value, True]
+            levels = [dark, dark, self._calcPixelCoefficient(value - minV)]
+        elif self.type == Knob.Type.BoostCut:
+            # branches are masks so value could be a per pad array (banks)
+            boost = value > 0.5
+            cut = value < 0.5
+            conditions = [boost & (minV < 0.5), boost & (maxV <= value), boost & (minV > value), boost,
+                          cut & (maxV > 0.5), cut & (minV >= value), cut & (maxV < value), cut,
+                          (minV == 0.5) | (maxV == 0.5), True]
+            levels = [dark, 1.0, dark, self._calcPixelCoefficient(value - minV),
+                      dark, 1.0, dark, 1.0 - self._calcPixelCoefficient(value - minV),
+                      1.0, dark]
+        elif self.type == Knob.Type.Wrap:
+            conditions = [maxV <= value, minV > value, True]
+            levels = [1.0, dark, self._calcPixelCoefficient(value - minV)]
+        elif self.type == Knob.Type.Spread:
+            upper = minV >= 0.5
+            lower = maxV <= 0.5
+            conditions = [upper & (minV > halfvalpluspointfive), upper & (maxV <= halfvalpluspointfive), upper,
+                          lower & (minV >= (1.0 - halfvalpluspointfive)), lower & (maxV < (1.0 - halfvalpluspointfive)), lower]
+            levels = [dark, 1.0, self._calcPixelCoefficient(halfvalpluspointfive - minV),
+                      1.0, dark, 1.0 - self._calcPixelCoefficient((1.0 - halfvalpluspointfive) - minV)]
+        elif self.type == Knob.Type.Collapse:
+            # fully collapsed knobs are dark, mask keeps value usable as a per pad array
+            opened = halfval < 0.5
+            upper = opened & (minV >= 0.5)
+            lower = opened & (maxV <= 0.5)
+            conditions = [lower & (minV > halfval), lower & (maxV <= halfval), lower,
+                          upper & (minV >= (1.0 - halfval)), upper & (maxV < (1.0 - halfval)), upper, True]
+            levels = [1.0, dark, 1.0 - self._calcPixelCoefficient(halfval - minV),
+                      dark, 1.0, self._calcPixelCoefficient((1.0 - halfval) - minV), dark]
+        return Widget._levels(minV.shape, conditions, levels)
     
+    @property
+    def _area(self) -> PyxelWidgets.Utils.Rectangle.Rectangle2D:
+        """ Rectangle of one knob, ring layout is relative to it """
+        return self.rect
+
     def _resize(self, width, height):
         self.perimeter = self._calcPerimeter(width, height)
-        self.indexes = [[self._calcKnobIndex(x, y) for y in range(height)] for x in range(width)]
-        self._minV = [self._calcKnobValue(index, 0.0) for index in range(self.perimeter)]
-        self._maxV = [self._calcKnobValue(index, 1.0) for index in range(self.perimeter)]
+        self.indexes = numpy.array([[self._calcKnobIndex(x, y, width, height) for y in range(height)] for x in range(width)], dtype = numpy.intp)
+        self._minV = numpy.array([self._calcKnobValue(index, 0.0) for index in range(self.perimeter)], dtype = numpy.float64)
+        self._maxV = numpy.array([self._calcKnobValue(index, 1.0) for index in range(self.perimeter)], dtype = numpy.float64)
+        # per pad copies of perimeter tables, pads inside the ring are not lit
+        self._ring = self.indexes != -1
+        self._cellMinV = numpy.where(self._ring, self._minV[self.indexes], 0.0)
+        self._cellMaxV = numpy.where(self._ring, self._maxV[self.indexes], 0.0)
         return True
 
-    def _calcKnobIndex(self, x: int, y: int) -> float:
-        if self.rect.w == 1:
+    def _calcKnobIndex(self, x: int, y: int, width: int = None, height: int = None) -> float:
+        # _resize runs before rect gets the new size, so it passes the size itself
+        width = self._area.w if width is None else width
+        height = self._area.h if height is None else height
+        if width == 1:
             return y
-        elif self.rect.h == 1:
+        elif height == 1:
             return x
-        halfwidth = int(self.rect.w / 2)
-        if y == (self.rect.h - 1):
+        halfwidth = int(width / 2)
+        if y == (height - 1):
             return (y + halfwidth + x) - 1
         elif x < halfwidth:
             if y == 0:
@@ -1160,7 +1438,7 @@ class Knob(Widget):
         elif x >= halfwidth:
             if y == 0:
                 return (self.perimeter - (x - halfwidth)) - 1
-            elif x == (self.rect.w - 1):
+            elif x == (width - 1):
                 return (self.perimeter - (x - halfwidth) - y) - 1
         return -1
 
@@ -1174,9 +1452,9 @@ class Knob(Widget):
             return 0.0
         halfperimeter = int(self.perimeter / 2)
         if index < halfperimeter:
-            return round(-(0.5 - self._minV[index]), 6)
+            return round(-(0.5 - float(self._minV[index])), 6)
         else:
-            return round(self._maxV[index] - 0.5, 6)
+            return round(float(self._maxV[index]) - 0.5, 6)
 
     def _calcPixelCoefficient(self, value: float) -> float:
         return value * self.perimeter
@@ -1188,16 +1466,94 @@ class Knob(Widget):
             return width
         return ((width - 1) * 2) + ((height - 1) * 2)
 
+# KnobBank class
+class KnobBank(Bank, Knob):
+    """
+    Description
+    ----
+    Many knobs in one widget, see Bank.
+    Knobs are knobWidth x knobHeight pads, placed left to right, bottom to
+     top. Type and coefficient are shared by every knob.
+
+    Parameters
+    ----
+    channels: int = knobs fitting in widget
+        Number of channels
+    knobWidth: int = 3
+    knobHeight: int = knobWidth
+    values: list = None
+        Initial channel values
+    """
+
+    _count = 0
+
+    def __init__(self, x: int, y: int, width: int, height: int, **kwargs):
+        kwargs['name'] = kwargs.get('name', f'KnobBank_{KnobBank._count}')
+        knobWidth = kwargs.get('knobWidth', 3)
+        self._tileSize = (knobWidth, kwargs.get('knobHeight', knobWidth))
+        self._initBank(kwargs.get('channels', (width // self._tileSize[0]) * (height // self._tileSize[1])), kwargs.get('values', None))
+        super().__init__(x, y, width, height, **kwargs)
+        KnobBank._count += 1
+
+    def press(self, x: int, y: int, value: float):
+        channel, x, y = self._locate(x, y)
+        if channel != -1:
+            if self._held == [-1, -1]:
+                self._channel = channel
+            if channel == self._channel:
+                super().press(x, y, value)
+
+    def release(self, x: int, y: int, value: float):
+        channel, x, y = self._locate(x, y)
+        if channel == self._channel:
+            super().release(x, y, value)
+
+    def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D):
+        if self.updated:
+            if not self.state:
+                self.updated = False
+            else:
+                self.tick()
+            self._flushChanges()
+            intersect = self.rect.intersect(rect)
+            if intersect is not None:
+                area = intersect - self.rect
+                previous = self.buffer.data[area.slice].copy()
+                values, visible = self._visibleValues(area)
+                level = self._calcPixelLevels(values, self._bankMinV[area.slice], self._bankMaxV[area.slice])
+                pixels = self._shade(level, previous)
+                pixels[~(visible & self._bankRing[area.slice])] = PyxelWidgets.Utils.Pixel.Colors.Invisible.value
+                self.buffer.data[area.slice] = pixels
+                return intersect, self.buffer[area.slice], pixels != previous
+        return None, None
+
+    @property
+    def _area(self) -> PyxelWidgets.Utils.Rectangle.Rectangle2D:
+        return PyxelWidgets.Utils.Rectangle.Rectangle2D(0, 0, self._tileSize[0], self._tileSize[1])
+
+    def _resize(self, width, height):
+        # tables of a single knob, pads of every tile share them
+        super()._resize(*self._tileSize)
+        self._layoutBank(width, height, *self._tileSize)
+        self._bankMinV = self._cellMinV[self._localX, self._localY]
+        self._bankMaxV = self._cellMaxV[self._localX, self._localY]
+        self._bankRing = self._ring[self._localX, self._localY]
+        return True
+
 # Sequencer class
 class Sequencer(Widget):
     def __init__(self, x: int, y: int, width: int, height: int, clock: PyxelWidgets.Utils.Clock.Clock = None, **kwargs):
         kwargs['name'] = kwargs.get('name', f'Sequencer_{Sequencer._count}')
-        self.state = numpy.ndarray((1, 1), dtype = numpy.bool8)
         self._steps = kwargs.get('steps', width * height)
+        self.pattern = kwargs.get('pattern', PyxelWidgets.Utils.Pattern.Pattern(self._steps))
+        self.pattern.steps = self._steps
+        self.scheduler = kwargs.get('scheduler', None)
+        self._scheduled = 0
+        self._lastTick = 0
+        self._generation = 0
         self._tick = 0
         self._pageCount = 1
         super().__init__(x, y, width, height, **kwargs)
-        self.state.fill(False)
         self.currentPage = 0
         self._page = 0
         self.follow = True
@@ -1245,24 +1601,47 @@ class Sequencer(Widget):
     @steps.setter
     def steps(self, value: int) -> None:
         self._steps = value
+        self.pattern.steps = value
         self._pageCount = int((self._steps - 1) / self.rect.area) + 1
-        self.state = numpy.zeros((self.rect.w, self.rect.h * self._pageCount), dtype = numpy.bool8)
         self._tick %= self._steps
         self.currentPage = int(self._tick / self.rect.area)
+        self._reschedule()
+        self.updated = True
+
+    @property
+    def state(self) -> numpy.ndarray:
+        """ Every page as read-only (width, height * pages) bool array, steps are stored in pattern """
+        pages = self.pattern.gates(0, self.rect.area * self._pageCount)
+        state = pages.reshape(self.rect.h * self._pageCount, self.rect.w).T
+        # writes to a copy would be lost silently, make them fail instead
+        state.flags.writeable = False
+        return state
+
+    @state.setter
+    def state(self, state: numpy.ndarray) -> None:
+        """ Replace steps with a (width, height * pages) bool array """
+        gates = numpy.asarray(state, dtype = numpy.bool_).T.reshape(-1)[:self._steps]
+        self.pattern.clear()
+        self.pattern.write(0, gates)
+        self._reschedule()
+        self.updated = True
 
     @property
     def current(self) -> bool:
-        self._tick
+        return self.pattern.get(int(self._tick))
     
     @current.setter
     def current(self, state: bool) -> None:
-        self.state[self._tickX(), self._tickY()] = state
+        self.pattern.set(int(self._tick), state)
+        self._reschedule()
         self.updated = True
 
     def tick(self, tick):
         if self.active:
+            if self.scheduler is not None:
+                self._schedule(tick)
             oldTick = self._tick
-            self._tick = tick / (self.ppq * ((4.0 / self.note) / self.beat))
+            self._tick = tick / self._ticksPerStep()
             self._tick %= self._steps
             if int(oldTick) != int(self._tick):
                 page = int(self._tick / self.rect.area)
@@ -1270,18 +1649,46 @@ class Sequencer(Widget):
                     self.currentPage = page
                     self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Page, self.currentPage)
                 self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Tick, int(self._tick))
-                if self._isTickActive():
+                if self.scheduler is None and self._isTickActive():
                     self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Active, int(self._tick))
                 self.updated = True
 
+    def _schedule(self, tick):
+        """ Queue Active events of steps inside lookahead window, steps queued before are skipped """
+        if tick < self._lastTick or self._generation != self.scheduler.generation:
+            # clock went back or was paused or stopped, queued events are gone or outdated
+            self.scheduler.cancel(self.name)
+            self._scheduled = tick
+            self._generation = self.scheduler.generation
+        self._lastTick = tick
+        self._scheduled = max(self._scheduled, tick)
+        horizon = tick + self.scheduler.ticks
+        if self.scheduler.running and horizon > self._scheduled:
+            _, steps, ticks = self.pattern.query(self._scheduled, horizon, self._ticksPerStep())
+            for step, at in zip(steps, ticks):
+                self.scheduler.scheduleTick(at, self.callback, self.name, PyxelWidgets.Utils.Enums.Event.Active, int(step), tag = self.name)
+            self._scheduled = horizon
+
+    def _reschedule(self):
+        """ Queue events again from current clock position after steps are changed """
+        if self.scheduler is not None and self._scheduled > self._lastTick:
+            self.scheduler.cancel(self.name)
+            self._scheduled = max(self._lastTick, self.scheduler.position)
+            self._schedule(self._lastTick)
+
+    def _ticksPerStep(self):
+        return self.ppq * ((4.0 / self.note) / self.beat)
+
     def press(self, x: int, y: int, value: float):
-        if self._calcTickPosition(x, y) < self._steps:
-            pageY = y + (self.rect.h * self._tickPage())
-            self.state[x, pageY] = not self.state[x, pageY]
+        step = self._calcTickPosition(x, y)
+        if step < self._steps:
+            self.pattern.toggle(step)
+            self._reschedule()
             self.updated = True
 
     def reset(self):
-        self.state.fill(False)
+        self.pattern.clear()
+        self._reschedule()
         self.updated = True
 
     def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D):
@@ -1290,22 +1697,22 @@ class Sequencer(Widget):
             intersect = self.rect.intersect(rect)
             if intersect is not None:
                 area = intersect - self.rect
+                previous = self.buffer[area.slice].copy()
                 tickP = self._tickPage()
                 tickX = self._tickX()
                 tickY = self._tickY() % self.rect.h
-                stateArea = area + PyxelWidgets.Utils.Rectangle.Rectangle2D(0, self.rect.h * tickP)
-                self.buffer[area.slice] = numpy.where(self.state[stateArea.slice] == True, self.activeColor, self.deactiveColor)
+                state = self.pattern.page(tickP, self.rect.area).reshape(self.rect.h, self.rect.w).T
+                self.buffer[area.slice] = PyxelWidgets.Utils.Pixel.PixelBuffer.where(state[area.slice], self.activeColor, self.deactiveColor)
                 if tickP == self.currentPage:
                     if self.buffer[tickX, tickY] == self.activeColor:
                         self.buffer[tickX, tickY] = self.currentActiveColor
                     else:
                         self.buffer[tickX, tickY] = self.currentColor
-            return intersect, self.buffer[area.slice]
+                return intersect, self.buffer[area.slice], self.buffer[area.slice] != previous
         return None, None
     
     def _resize(self, width, height):
         self._pageCount = int((self._steps - 1) / (width * height)) + 1
-        self.state.resize((width, height * self._pageCount), refcheck = False)
         self._tick %= self._steps
         return True
     
@@ -1322,23 +1729,196 @@ class Sequencer(Widget):
         return int(self._tick // self.rect.w)
     
     def _isTickActive(self):
-        return self.state[self._tickX()][self._tickY()]
+        return self.pattern.get(int(self._tick))
     
+# SequencerBank class
+class SequencerBank(Widget):
+    """
+    Description
+    ----
+    Many sequencer lanes driven by one clock target.
+    Every row is one lane, every column is one step of lane's current page.
+    Lanes could have their own length and note value, all lane positions
+     are calculated together at every clock tick and Tick / Active events
+      are sent once per tick for every lane which moved.
+
+    Parameters
+    ----
+    lanes: int = height
+        Number of lanes
+    steps: int or list = width
+        Step count of every lane
+    note: float or list = 4.0
+        Note value of a step of every lane, 4.0 is quarter note
+    beat: float = 4.0
+    ppq: int = 24
+
+    Events
+    ----
+    Tick: (lanes, steps) arrays of lanes moved to a new step
+    Active: (lanes, steps) arrays of lanes moved to an active step
+    Page: (lanes, pages) arrays of lanes moved to a new page
+    """
+    def __init__(self, x: int, y: int, width: int, height: int, clock: PyxelWidgets.Utils.Clock.Clock = None, **kwargs):
+        kwargs['name'] = kwargs.get('name', f'SequencerBank_{SequencerBank._count}')
+        self.lanes = kwargs.get('lanes', height)
+        self.lengths = numpy.broadcast_to(numpy.asarray(kwargs.get('steps', width), dtype = numpy.int64), (self.lanes,)).copy()
+        self.notes = numpy.broadcast_to(numpy.asarray(kwargs.get('note', 4.0), dtype = numpy.float64), (self.lanes,)).copy()
+        self.pattern = kwargs.get('pattern', PyxelWidgets.Utils.Pattern.Pattern(int(self.lengths.max()), self.lanes))
+        self.positions = numpy.zeros(self.lanes, dtype = numpy.int64)
+        self.pages = numpy.zeros(self.lanes, dtype = numpy.int64)
+        self._page = numpy.zeros(self.lanes, dtype = numpy.int64)
+        self._laneIndex = numpy.arange(self.lanes)
+        super().__init__(x, y, width, height, **kwargs)
+        self.lane = 0
+        self.follow = True
+        self.active = True
+        self.beat = kwargs.get('beat', 4.0)
+        self.ppq = kwargs.get('ppq', 24)
+        self.currentColor = kwargs.get('currentColor', PyxelWidgets.Utils.Pixel.Colors.Lime)
+        self.currentActiveColor = kwargs.get('currentActiveColor', PyxelWidgets.Utils.Pixel.Colors.Red)
+        self.target = PyxelWidgets.Utils.Clock.Target(self.tick, name = self.name)
+        if clock != None:
+            self.addToClock(clock)
+        SequencerBank._count += 1
+
+    def addToClock(self, clock: PyxelWidgets.Utils.Clock.Clock):
+        self.ppq = clock.ppq
+        clock.addTarget(self.target)
+
+    def setSteps(self, lane: int, steps: int) -> None:
+        self.lengths[lane] = steps
+        self.pattern.steps = int(self.lengths.max())
+        self.positions %= self.lengths
+        self.pages = self.positions // self.rect.w
+        self.updated = True
+
+    def setNote(self, lane: int, note: float) -> None:
+        self.notes[lane] = note
+
+    def setPage(self, lane: int, page: int) -> None:
+        self._page[lane] = page % (((self.lengths[lane] - 1) // self.rect.w) + 1)
+        self.updated = True
+
+    def tick(self, tick):
+        if self.active:
+            positions = (tick // (self.ppq * ((4.0 / self.notes) / self.beat))).astype(numpy.int64) % self.lengths
+            moved = positions != self.positions
+            if moved.any():
+                self.positions = positions
+                lanes = self._laneIndex[moved]
+                steps = positions[moved]
+                pages = steps // self.rect.w
+                turned = pages != self.pages[moved]
+                self.pages[moved] = pages
+                if turned.any():
+                    self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Page, (lanes[turned], pages[turned]))
+                self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Tick, (lanes, steps))
+                active = self._gates(lanes, steps)
+                if active.any():
+                    self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Active, (lanes[active], steps[active]))
+                self.updated = True
+
+    def press(self, x: int, y: int, value: float):
+        lane = y + self.lane
+        if lane < self.lanes:
+            step = (self._shownPages()[lane] * self.rect.w) + x
+            if step < self.lengths[lane]:
+                self.pattern.toggle(int(step), lane)
+                self.updated = True
+
+    def reset(self, lane: int = None):
+        self.pattern.clear(lane)
+        self.updated = True
+
+    def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D):
+        if self.updated:
+            self.updated = False
+            intersect = self.rect.intersect(rect)
+            if intersect is not None:
+                area = intersect - self.rect
+                previous = self.buffer[area.slice].copy()
+                lanes = numpy.arange(self.lane, self.lane + self.rect.h)
+                visible = lanes < self.lanes
+                lanes = numpy.minimum(lanes, self.lanes - 1)
+                columns = numpy.arange(self.rect.w)
+                steps = (self._shownPages()[lanes] * self.rect.w)[None, :] + columns[:, None]
+                valid = visible[None, :] & (steps < self.lengths[lanes][None, :])
+                state = valid & self._gates(lanes[None, :], numpy.minimum(steps, self.pattern.steps - 1))
+                current = valid & (steps == self.positions[lanes][None, :])
+                data = numpy.where(state, self.activeColor.value, self.deactiveColor.value)
+                data = numpy.where(current, numpy.where(state, self.currentActiveColor.value, self.currentColor.value), data)
+                self.buffer.data[area.slice] = data[area.slice]
+                return intersect, self.buffer[area.slice], self.buffer[area.slice] != previous
+        return None, None
+
+    def _resize(self, width, height):
+        self.pages = self.positions // width
+        self._page %= ((self.lengths - 1) // width) + 1
+        return True
+
+    def _shownPages(self) -> numpy.ndarray:
+        return self.pages if self.follow else self._page
+
+    def _gates(self, lanes: numpy.ndarray, steps: numpy.ndarray) -> numpy.ndarray:
+        """ Gates of (lane, step) pairs read straight from packed pattern bits """
+        return ((self.pattern.bits[lanes, steps >> 3] >> (steps & 7).astype(numpy.uint8)) & 1).astype(numpy.bool_)
+
 # Sprite class
 class Sprite(Widget):
-    def __init__(self, x: int, y: int, width: int, height: int, **kwargs):
+    """
+    Description
+    ----
+    Plays frames of an animation. Playback is driven by one of
+     fps: frame is chosen from time.monotonic() time since start,
+     clock: frame follows clock ticks, framesPerBeat frames every beat,
+     target: frame advances every target updates (default).
+    Time and clock driven playback skip frames when updates fall behind.
+    """
+    def __init__(self, x: int, y: int, width: int, height: int, clock: PyxelWidgets.Utils.Clock.Clock = None, **kwargs):
         kwargs['name'] = kwargs.get('name', f'Sprite_{Sprite._count}')
         super().__init__(x=x, y=y, width=width, height=height, **kwargs)
         self.animate = kwargs.get('animate', False)
         self.frames = kwargs.get('frames', None)
         self.target = kwargs.get('target', 30)
         self.tick = kwargs.get('tick', 0)
+        self.fps = kwargs.get('fps', None)
+        self.framesPerBeat = kwargs.get('framesPerBeat', 1.0)
+        self.ppq = kwargs.get('ppq', 24)
         self.currentFrame = 0
         self.nextFrame = 0
-        if not isinstance(self.frames, numpy.ndarray):
-            self.frames = [numpy.ndarray((self.rect.w, self.rect.h))]
-            self.frames[0].fill(PyxelWidgets.Utils.Pixel.Colors.Invisible)
-        self.buffer = self.frames[0]
+        if self.frames is None:
+            self.frames = PyxelWidgets.Utils.Animation.FrameStore([PyxelWidgets.Utils.Pixel.PixelBuffer(self.rect.w, self.rect.h, PyxelWidgets.Utils.Pixel.Colors.Invisible)])
+        elif isinstance(self.frames, str):
+            if self.frames.endswith('.npz'):
+                self.frames = PyxelWidgets.Utils.Animation.DeltaAnimation.load(self.frames)
+            else:
+                self.frames = PyxelWidgets.Utils.Animation.MappedFrameStore(self.frames, self.rect.w, self.rect.h)
+        elif not isinstance(self.frames, (PyxelWidgets.Utils.Animation.FrameStore, PyxelWidgets.Utils.Animation.DeltaAnimation)):
+            self.frames = PyxelWidgets.Utils.Animation.FrameStore(self.frames)
+        self._shown = 0
+        if isinstance(self.frames, PyxelWidgets.Utils.Animation.DeltaAnimation):
+            # delta frames are applied in place, so sprite owns its buffer
+            self.buffer = PyxelWidgets.Utils.Pixel.PixelBuffer(data = self.frames.frame(0))
+        else:
+            self.buffer = self.frames[0]
+        self.clock = None
+        self.clockTarget = PyxelWidgets.Utils.Clock.Target(self._clockTick, name = self.name)
+        self._start = time.monotonic()
+        if clock != None:
+            self.addToClock(clock)
+        Sprite._count += 1
+
+    def addToClock(self, clock: PyxelWidgets.Utils.Clock.Clock):
+        self.clock = clock
+        self.ppq = clock.ppq
+        clock.addTarget(self.clockTarget)
+
+    def restart(self):
+        """ Start time based playback from first frame """
+        self._start = time.monotonic()
+        self.nextFrame = 0
+        self.updated = True
 
     def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D):
         if self.updated:
@@ -1346,19 +1926,49 @@ class Sprite(Widget):
             intersect = self.rect.intersect(rect)
             if intersect is not None:
                 area = intersect - self.rect
-                self.buffer = self.frames[self.nextFrame]
-                if self.animate:
-                    self.tick += 1
-                    if self.tick == self.target:
-                        self.tick = 0
-                        self.currentFrame = self.nextFrame
-                        self.nextFrame += 1
-                        if self.nextFrame == len(self.frames):
-                            self.nextFrame = 0
-                    self.updated = True
-            return intersect, self.buffer[area.slice]
+                if self.animate and self.fps is not None and self.clock is None:
+                    self.nextFrame = int((time.monotonic() - self._start) * self.fps) % len(self.frames)
+                changes = self._show(self.nextFrame)
+                self.currentFrame = self._shown
+                # clock driven sprites advance from clock ticks
+                if self.animate and self.clock is None:
+                    if self.fps is not None:
+                        # keep polling, frame is picked from time at next update
+                        self.updated = True
+                    else:
+                        self.tick += 1
+                        if self.tick == self.target:
+                            self.tick = 0
+                            self.nextFrame += 1
+                            if self.nextFrame == len(self.frames):
+                                self.nextFrame = 0
+                        self.updated = True
+                if changes is not None:
+                    mask = numpy.zeros(self.buffer.shape, dtype = numpy.bool_)
+                    mask.reshape(-1)[changes] = True
+                    return intersect, self.buffer[area.slice], mask[area.slice]
+                return intersect, self.buffer[area.slice]
         return None, None
 
+    def _clockTick(self, tick):
+        if self.animate:
+            frame = int((tick * self.framesPerBeat) / self.ppq) % len(self.frames)
+            if frame != self.nextFrame:
+                self.nextFrame = frame
+                self.updated = True
+
+    def _show(self, index: int) -> numpy.ndarray:
+        """ Bring buffer to frame, returns flat indices of changed cells or None if whole buffer changed """
+        if isinstance(self.frames, PyxelWidgets.Utils.Animation.DeltaAnimation):
+            changes = self.frames.apply(self.buffer, self._shown, index)
+        elif index == self._shown:
+            changes = numpy.zeros(0, dtype = numpy.intp)
+        else:
+            self.buffer = self.frames[index]
+            changes = None
+        self._shown = index
+        return changes
+
 # Tracker class
 class Tracker(Widget):
 
@@ -1377,11 +1987,17 @@ class Tracker(Widget):
         self.numerator = kwargs.get('numerator', 1.0)
         self.denominator = kwargs.get('denominator', 4.0)
         self.ppq = kwargs.get('ppq', 24)
-        super().__init__(x, y, width, height, **kwargs)
-        self.states.fill(False)
+        self.scheduler = None
+        self._scheduled = 0
+        self._lastTick = 0
+        self._generation = 0
         self.currentTop = 0
-        self.currentBottom = self.currentTop + self.height - 1
+        self.currentBottom = height - 1
         self.currentPage = 0
+        self._view = None
+        super().__init__(x, y, width, height, **kwargs)
+        self.states.fill(False)
+        self.scheduler = kwargs.get('scheduler', None)
         self.currentColor = kwargs.get('currentColor', PyxelWidgets.Utils.Pixel.Colors.Cyan)
         self.currentActiveColor = kwargs.get('currentActiveColor', PyxelWidgets.Utils.Pixel.Colors.Magenta)
         self.target = PyxelWidgets.Utils.Clock.Target(self.tick, name = self.name)
@@ -1395,38 +2011,71 @@ class Tracker(Widget):
 
     def press(self, x: int, y: int, value: float):
         self.states[self.currentPage, x, self.rect.h - 1 - y + self.currentTop] = not self.states[self.currentPage, x, self.rect.h - 1 - y + self.currentTop]
+        self._reschedule()
+        self._view = None
         self.updated = True
 
     def scroll(self, bar):
-        self.tick(bar * (self.ppq * (self.numerator / self.denominator)))
+        self.tick(bar * self._ticksPerBar())
 
     def tick(self, tick):
+        if self.scheduler is not None:
+            self._schedule(tick)
         oldBar = self.currentBar
-        self.currentBar = tick / (self.ppq * (self.numerator / self.denominator))
+        self.currentBar = tick / self._ticksPerBar()
         self.currentPage = int(self.currentBar / self.bars)
         self.currentPage %= self.pages
         self.currentBar %= self.bars
         if int(oldBar) != int(self.currentBar):
             self.updated = True
-            self.currentBar = self.currentBar
-            halfHeight = self.height // 2
-            # if self.scroll == Tracker.Scroll.Continuous:
-            corr = int(not (self.height % 2))
-            if self.currentBar < halfHeight:
-                self.currentTop = 0
-                self.currentBottom = int(self.currentTop + self.height - 1)
-            elif self.currentBar >= self.bars - halfHeight:
-                self.currentTop = int(self.bars - self.height)
-                self.currentBottom = int(self.bars - corr)
-            else:
-                self.currentTop = int(self.currentBar - (halfHeight - corr))
-                self.currentBottom = int(self.currentBar + halfHeight)
-            # elif self.scroll == Tracker.Scroll.Page:
-            #     pass
+            self._scroll(self.rect.h)
             self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Tick, int(self.currentBar))
-            for i, state in enumerate(self.states[self.currentPage, :, int(self.currentBar)]):
-                if state:
-                    self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Active, (int(self.currentBar), i))
+            if self.scheduler is None:
+                for i in numpy.flatnonzero(self.states[self.currentPage, :, int(self.currentBar)]):
+                    self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Active, (int(self.currentBar), int(i)))
+
+    def _scroll(self, height):
+        """ Keep current bar centered while it is not near first or last bar """
+        # if self.scroll == Tracker.Scroll.Continuous:
+        corr = int(not (height % 2))
+        top = int(self.currentBar) - ((height // 2) - corr)
+        self.currentTop = min(max(top, 0), self.bars - height)
+        self.currentBottom = self.currentTop + height - 1
+        # elif self.scroll == Tracker.Scroll.Page:
+        #     pass
+
+    def _schedule(self, tick):
+        """ Queue Active events of bars inside lookahead window, bars queued before are skipped """
+        if tick < self._lastTick or self._generation != self.scheduler.generation:
+            # clock went back or was paused or stopped, queued events are gone or outdated
+            self.scheduler.cancel(self.name)
+            self._scheduled = tick
+            self._generation = self.scheduler.generation
+        self._lastTick = tick
+        self._scheduled = max(self._scheduled, tick)
+        horizon = tick + self.scheduler.ticks
+        ticksPerBar = self._ticksPerBar()
+        first = int(numpy.ceil(self._scheduled / ticksPerBar))
+        last = int(numpy.ceil(horizon / ticksPerBar))
+        if self.scheduler.running:
+            if last > first:
+                indexes = numpy.arange(first, last)
+                bars = indexes % self.bars
+                pages = (indexes // self.bars) % self.pages
+                rows, columns = numpy.nonzero(self.states[pages, :, bars])
+                for row, column in zip(rows, columns):
+                    self.scheduler.scheduleTick(indexes[row] * ticksPerBar, self.callback, self.name, PyxelWidgets.Utils.Enums.Event.Active, (int(bars[row]), int(column)), tag = self.name)
+            self._scheduled = max(self._scheduled, horizon)
+
+    def _reschedule(self):
+        """ Queue events again from current clock position after states are changed """
+        if self.scheduler is not None and self._scheduled > self._lastTick:
+            self.scheduler.cancel(self.name)
+            self._scheduled = max(self._lastTick, self.scheduler.position)
+            self._schedule(self._lastTick)
+
+    def _ticksPerBar(self):
+        return self.ppq * (self.numerator / self.denominator)
 
     def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D) -> tuple:
         if self.updated:
@@ -1434,14 +2083,53 @@ class Tracker(Widget):
             intersect = self.rect.intersect(rect)
             if intersect is not None:
                 area = intersect - self.rect
-                self.buffer[area.slice] = numpy.fliplr(numpy.where(self.states[self.currentPage, :, self.currentTop:(self.currentBottom + 1)] == True, self.activeColor, self.deactiveColor))
-                self.buffer[:, int(self.currentBottom - self.currentBar)] = numpy.where(self.states[self.currentPage, :, int(self.currentBar)] == True, self.currentActiveColor, self.currentColor)
-            return intersect, self.buffer[area.slice]
+                previous = self.buffer[area.slice].copy()
+                self._render()
+                return intersect, self.buffer[area.slice], self.buffer[area.slice] != previous
         return None, None
 
+    def _render(self):
+        """
+        Description
+        ----
+        Bring buffer to current view. Rows are shifted when view scrolls,
+         so only newly exposed rows and old and new current bar rows are
+          drawn from states. Row y shows bar currentBottom - y.
+        """
+        h = self.rect.h
+        bar = int(self.currentBar)
+        data = self.buffer.data
+        if self._view is None or self._view[0] != self.currentPage or abs(self.currentTop - self._view[1]) >= h:
+            self._renderRows(numpy.arange(h))
+        else:
+            shift = self.currentTop - self._view[1]
+            if shift > 0:
+                data[:, shift:] = data[:, :-shift]
+                self._renderRows(numpy.arange(shift))
+            elif shift < 0:
+                data[:, :shift] = data[:, -shift:]
+                self._renderRows(numpy.arange(h + shift, h))
+            oldY = self.currentBottom - self._view[2]
+            if 0 <= oldY < h and self._view[2] != bar:
+                self._renderRows(numpy.array([oldY]))
+        y = self.currentBottom - bar
+        data[:, y] = numpy.where(self.states[self.currentPage, :, bar], self.currentActiveColor.value, self.currentColor.value)
+        self._view = (self.currentPage, self.currentTop, bar)
+
+    def _renderRows(self, rows: numpy.ndarray):
+        bars = self.currentBottom - rows
+        states = self.states[self.currentPage][:, bars]
+        self.buffer.data[:, rows] = numpy.where(states, self.activeColor.value, self.deactiveColor.value)
+
+    def clearRenderCache(self) -> None:
+        super().clearRenderCache()
+        self._view = None
+
     def _resize(self, width, height) -> bool:
         self.states.resize((self.pages, width, self.bars), refcheck = False)
         self.tick(0)
+        self._scroll(height)
+        self._view = None
         return True
 
 # XY class
@@ -1453,9 +2141,10 @@ class XY(Widget):
 
     def __init__(self, x: int, y: int, width: int, height: int, **kwargs):
         kwargs['name'] = kwargs.get('name', f'XY_{XY._count}')
+        self._xColor = kwargs.get('xColor', PyxelWidgets.Utils.Pixel.Colors.Cyan)
+        self._yColor = kwargs.get('yColor', PyxelWidgets.Utils.Pixel.Colors.Magenta)
+        self._buildRamps()
         super().__init__(x, y, width, height, **kwargs)
-        self.xColor = kwargs.get('xColor', PyxelWidgets.Utils.Pixel.Colors.Cyan)
-        self.yColor = kwargs.get('yColor', PyxelWidgets.Utils.Pixel.Colors.Magenta)
         self.delta = [0.0, 0.0]
         self._value = [0.0, 0.0]
         self._heldButton = [-1, -1]
@@ -1472,6 +2161,28 @@ class XY(Widget):
             if self._value != oldValue:
                 self.updated = True
 
+    @property
+    def xColor(self) -> PyxelWidgets.Utils.Pixel.Pixel:
+        return self._xColor
+
+    @xColor.setter
+    def xColor(self, color: PyxelWidgets.Utils.Pixel.Pixel) -> None:
+        self._xColor = color
+        self._buildRamps()
+        self.clearRenderCache()
+        self.updated = True
+
+    @property
+    def yColor(self) -> PyxelWidgets.Utils.Pixel.Pixel:
+        return self._yColor
+
+    @yColor.setter
+    def yColor(self, color: PyxelWidgets.Utils.Pixel.Pixel) -> None:
+        self._yColor = color
+        self._buildRamps()
+        self.clearRenderCache()
+        self.updated = True
+
     def press(self, x: int, y: int, value: float):
         if self._heldButton[0] >= 0 and self._heldButton[1] >= 0:
             self.setValue(self._calcXYValueWithMagnitude(self._heldButton[0], self._heldButton[1], x, y))
@@ -1493,32 +2204,66 @@ class XY(Widget):
             intersect = self.rect.intersect(rect)
             if intersect is not None:
                 area = intersect - self.rect
-                xPoint = self._findXPoint()
-                yPoint = self._findYPoint()
-                self.buffer[area.slice] = self.deactiveColor
-                self.buffer[xPoint, area.slice[1]] = self.xColor * self._value[0]
-                self.buffer[area.slice[0], yPoint] = self.yColor * self._value[1]
-                minV = self._minV[xPoint][yPoint]
-                coefficientX = ((self.value[0] - minV[0]) * self.rect.w) / 2
-                coefficientY = ((self.value[1] - minV[1]) * self.rect.h) / 2
-                color = (self.xColor * coefficientX) + (self.yColor * coefficientY)
-                self.buffer[xPoint, yPoint] = color
-            return intersect, self.buffer[area.slice]
+                if not self._restoreFrame(area):
+                    value = self._renderValue()
+                    xPoint = self._findXPoint(value)
+                    yPoint = self._findYPoint(value)
+                    coefficientX = ((value[0] - self._minV[0][xPoint]) * self.rect.w) / 2
+                    coefficientY = ((value[1] - self._minV[1][yPoint]) * self.rect.h) / 2
+                    colors = numpy.array(self._crosshairColors(value, coefficientX, coefficientY), dtype = numpy.uint32)
+                    self.buffer.data[area.slice] = colors[self._crosshair(xPoint, yPoint)[area.slice]]
+                    self._storeFrame(area)
+                return intersect, self.buffer[area.slice]
         return None, None
 
+    def _renderConfig(self) -> tuple:
+        return (self.xColor.value, self.yColor.value)
+
+    def _buildRamps(self) -> None:
+        """ Channels of x and y colors and alphas of x, y and center colors used by crosshair renderer """
+        self._ramps = (self._xColor.color, self._yColor.color)
+        alphaX = self._xColor.value >> 24
+        alphaY = self._yColor.value >> 24
+        self._alphas = (alphaX << 24, alphaY << 24, min(255, alphaX + alphaY) << 24)
+
+    def _crosshairColors(self, value: list, coefficientX: float, coefficientY: float) -> list:
+        """ Packed background, x line, y line and center colors, same truncation and clipping as Pixel multiplication and addition """
+        (xr, xg, xb), (yr, yg, yb) = self._ramps
+        alphaX, alphaY, alphaC = self._alphas
+        valueX, valueY = value
+        xPixel = (int(xr * valueX) << 16) | (int(xg * valueX) << 8) | int(xb * valueX)
+        yPixel = (int(yr * valueY) << 16) | (int(yg * valueY) << 8) | int(yb * valueY)
+        r = min(255, int(xr * coefficientX) + int(yr * coefficientY))
+        g = min(255, int(xg * coefficientX) + int(yg * coefficientY))
+        b = min(255, int(xb * coefficientX) + int(yb * coefficientY))
+        return [self.deactiveColor.value, xPixel | alphaX, yPixel | alphaY, (r << 16) | (g << 8) | b | alphaC]
+
+    def _crosshair(self, xPoint: int, yPoint: int) -> numpy.ndarray:
+        """ Cached color indexes of crosshair, 0 background, 1 x line, 2 y line, 3 center """
+        key = (xPoint, yPoint)
+        crosshair = self._crosshairs.get(key)
+        if crosshair is None:
+            crosshair = self._columns[xPoint][:, None] | self._rows[yPoint][None, :]
+            self._crosshairs[key] = crosshair
+        return crosshair
+
     def _resize(self, width, height) -> bool:
-        self._minV = [[self._calcXYValue(x, y, 0.0) for y in range(height)] for x in range(width)]
-        self._maxV = [[self._calcXYValue(x, y, 1.0) for y in range(height)] for x in range(width)]
+        # plain float tables, crosshair colors are calculated with python scalars
+        self._minV = (numpy.round(numpy.arange(width) / width, 6).tolist(), numpy.round(numpy.arange(height) / height, 6).tolist())
+        self._maxV = (numpy.round((numpy.arange(width) + 1) / width, 6).tolist(), numpy.round((numpy.arange(height) + 1) / height, 6).tolist())
+        self._columns = numpy.eye(width, dtype = numpy.uint8)
+        self._rows = numpy.eye(height, dtype = numpy.uint8) * 2
+        self._crosshairs = {}
         return True
 
-    def _findXPoint(self):
-        point = (self._value[0] * self.rect.w)
+    def _findXPoint(self, value: list = None):
+        point = ((self._value if value is None else value)[0] * self.rect.w)
         if point > 0.0:
             point = point - 1 if point % 1.0 == 0.0 else point
         return int(point)
     
-    def _findYPoint(self):
-        point = (self._value[1] * self.rect.h)
+    def _findYPoint(self, value: list = None):
+        point = ((self._value if value is None else value)[1] * self.rect.h)
         if point > 0.0:
             point = point - 1 if point % 1.0 == 0.0 else point
         return int(point)
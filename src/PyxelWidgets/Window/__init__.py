@@ -1,9 +1,11 @@
+import PyxelWidgets.Utils.Compositor
 import PyxelWidgets.Utils.Enums
 import PyxelWidgets.Utils.Pixel
 import PyxelWidgets.Utils.Rectangle
 import PyxelWidgets.Widgets
 import PyxelWidgets.Controllers
 import PyxelWidgets.Utils.Effect
+import collections
 import numpy
 
 class Window():
@@ -14,61 +16,219 @@ class Window():
         self.name = kwargs.get('name', f'Window_{Window._count}')
         self.rect = PyxelWidgets.Utils.Rectangle.Rectangle2D(0, 0, width, height)
         self.widgets = {}
-        self.buffer = numpy.ndarray((self.rect.w, self.rect.h), PyxelWidgets.Utils.Pixel.Pixel)
-        self.buffer.fill(PyxelWidgets.Utils.Pixel.Colors.Invisible)
+        self.buffer = PyxelWidgets.Utils.Pixel.PixelBuffer(self.rect.w, self.rect.h, PyxelWidgets.Utils.Pixel.Colors.Invisible)
         self.frameCounter = 0
+        self.blend = kwargs.get('blend', PyxelWidgets.Utils.Compositor.Blend.Over)
         self.callback = kwargs.get('callback', lambda *_, **__: None)
+        self.coalesce = kwargs.get('coalesce', False)
+        self._changed = {}
+        self._cells = []
+        self._order = {}
+        self._dirty = collections.deque()
+        self.damage = PyxelWidgets.Utils.Rectangle.Region([self.rect])
+        self.reindex()
         Window._count += 1
 
     def addWidget(self, widget: PyxelWidgets.Widgets.Widget):
-        self.widgets[widget.name] = widget
-        widget.updated = True
+        self._attach(widget)
+        self.reindex()
+        self.redraw(widget.rect)
     
     def addWidgets(self, widgets):
         for widget in widgets:
-            self.widgets[widget.name] = widget
-            widget.updated = True
+            self._attach(widget)
+        self.reindex()
+        for widget in widgets:
+            self.redraw(widget.rect)
     
     def removeWidget(self, name: str):
         if name in self.widgets:
-            self.widgets.pop(name)
+            widget = self.widgets.pop(name)
+            self._detach(widget)
+            self.reindex()
+            self.redraw(widget.rect)
+
+    def _attach(self, widget: PyxelWidgets.Widgets.Widget):
+        old = self.widgets.get(widget.name)
+        if old is not None and old is not widget:
+            self._detach(old)
+        self.widgets[widget.name] = widget
+        if self not in widget._windows:
+            widget._windows.append(self)
+        widget.updated = True
+
+    def _detach(self, widget: PyxelWidgets.Widgets.Widget):
+        if self in widget._windows:
+            widget._windows.remove(self)
+
+    def reindex(self):
+        """ Rebuild cell to widget index used for input routing """
+        cells = [[[] for y in range(self.rect.h)] for x in range(self.rect.w)]
+        for widget in self.widgets.values():
+            overlap = self.rect.intersect(widget.rect)
+            if overlap is not None:
+                for x in overlap.columns:
+                    for y in overlap.rows:
+                        cells[x][y].append(widget)
+        self._cells = [[tuple(cell) for cell in column] for column in cells]
+        self._order = {widget: index for index, widget in enumerate(self.widgets.values())}
+
+    def redraw(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D):
+        """ Recompose rect from current widget buffers, used when widgets are added, removed or resized """
+        area = self.rect.intersect(rect)
+        if area is not None:
+            self._compose(area)
+
+    def markDirty(self, widget: PyxelWidgets.Widgets.Widget):
+        """ Queue widget for the next update, called by widgets when they change """
+        self._dirty.append(widget)
     
     def forceUpdate(self):
-        self.buffer.fill(PyxelWidgets.Utils.Pixel.Colors.Invisible)
+        # widgets may only report changed cells, so rebuild everything from their buffers first
+        self._compose(self.rect)
         for widget in list(self.widgets.values()):
             widget.updated = True
 
     def process(self, name, event, data):
         if event != PyxelWidgets.Utils.Enums.Event.Custom:
             x, y, value = data
-            b = PyxelWidgets.Utils.Rectangle.Rectangle2D(x, y)
-            if self.rect.collide(b):
-                for widget in list(self.widgets.values()):
-                    if widget.rect.collide(b):
-                        widget.process(name, event, data)
+            if 0 <= x < self.rect.w and 0 <= y < self.rect.h:
+                for widget in self._cells[x][y]:
+                    widget.process(name, event, data)
         else:
             self.callback(name, event, data)
     
     def setCallback(self, callback) -> None:
         self.callback = callback
 
+    def setValues(self, values, notify: bool = True, coalesce: bool = None) -> None:
+        """
+        Description
+        ----
+        Set values of many widgets at once, for example automation fed
+        back from a DAW. Only the last value of every widget or bank
+        channel is applied, so every changed widget is queued for
+        rendering once. Keys which match no widget are skipped.
+
+        Parameters
+        ----
+        values: dict or list of (key, value) pairs
+            key is widget name or index of widget in order of addition,
+            (key, channel) addresses one channel of a bank widget.
+            Bank widgets take a scalar for last touched channel, a list
+            with a value of every channel or a (channels, values) pair
+        notify: bool = True
+            Send Changed events of changed widgets
+        coalesce: bool = None
+            Send Changed events at next update, once per widget with its
+            last value, Window.coalesce is used if None
+        """
+        coalesce = self.coalesce if coalesce is None else coalesce
+        items = values.items() if isinstance(values, dict) else values
+        widgets = list(self.widgets.values())
+        latest = {}
+        banks = {}
+        for key, value in items:
+            channel = None
+            if isinstance(key, tuple):
+                key, channel = key
+            if isinstance(key, int):
+                widget = widgets[key] if 0 <= key < len(widgets) else None
+            else:
+                widget = self.widgets.get(key)
+            if widget is None:
+                continue
+            if isinstance(widget, PyxelWidgets.Widgets.Bank):
+                channels = banks.setdefault(widget, {})
+                if channel is not None:
+                    channels[channel] = value
+                elif isinstance(value, tuple) and len(value) == 2 and numpy.ndim(value[0]) > 0:
+                    channels.update(zip(numpy.asarray(value[0]).tolist(), numpy.broadcast_to(value[1], numpy.shape(value[0])).tolist()))
+                elif numpy.ndim(value) == 0:
+                    channels[widget._channel] = value
+                else:
+                    channels.update(enumerate(numpy.asarray(value).tolist()))
+            elif channel is None:
+                latest[widget] = value
+        for widget, channels in banks.items():
+            channels = {channel: value for channel, value in channels.items() if 0 <= channel < widget.channels}
+            if channels:
+                widget.setValues(list(channels.values()), list(channels.keys()), notify)
+                if notify and not coalesce:
+                    widget._flushChanges()
+        for widget, value in latest.items():
+            old = self._copyValue(widget.value)
+            widget.value = value
+            value = self._copyValue(widget.value)
+            if notify and value != old:
+                if coalesce:
+                    self._changed[widget] = value
+                else:
+                    widget.callback(widget.name, PyxelWidgets.Utils.Enums.Event.Changed, value)
+
+    @staticmethod
+    def _copyValue(value):
+        # XY keeps its value in a list which is changed in place
+        return list(value) if isinstance(value, list) else value
+
+    def _flushChanged(self) -> None:
+        """ Send Changed events coalesced by setValues """
+        changed, self._changed = self._changed, {}
+        for widget, value in changed.items():
+            widget.callback(widget.name, PyxelWidgets.Utils.Enums.Event.Changed, value)
+
     def updateArea(self, rect: PyxelWidgets.Utils.Rectangle.Rectangle2D):
         self.callback(self.name, PyxelWidgets.Utils.Enums.Event.Frame, self.frameCounter)
         self.frameCounter += 1
+        if self._changed:
+            self._flushChanged()
         intersect = self.rect.intersect(rect)
         if intersect:
-            for widget in list(self.widgets.values()):
+            dirty = {}
+            while self._dirty:
+                widget = self._dirty.popleft()
+                if widget in self._order:
+                    dirty[widget] = None
+            for widget in sorted(dirty, key = self._order.get):
                 if widget.updated:
-                    area, buffer = widget.updateArea(intersect)
+                    result = widget.updateArea(intersect)
+                    area, buffer = result[0], result[1]
                     if buffer is not None:
-                        view = self.buffer[area.slice]
-                        view[:] = numpy.where(buffer == False, view, buffer)
+                        if len(result) > 2 and result[2] is not None:
+                            for changed in self._changes(area, result[2]):
+                                self._compose(changed)
+                        else:
+                            self._compose(area)
+                    # widgets animating on their own stay updated, keep them queued
+                    if widget.updated:
+                        self._dirty.append(widget)
             return intersect, self.buffer[intersect.slice]
         return None, None
 
     def update(self):
         return self.updateArea(self.rect)
 
+    def _changes(self, area: PyxelWidgets.Utils.Rectangle.Rectangle2D, changes):
+        """ Changed cells reported by a widget as window rectangles, changes is a boolean mask or a list of (x, y) cells relative to area """
+        if isinstance(changes, numpy.ndarray):
+            return PyxelWidgets.Utils.Rectangle.Region.fromMask(changes, area.x, area.y)
+        region = PyxelWidgets.Utils.Rectangle.Region()
+        for x, y in changes:
+            region.add(PyxelWidgets.Utils.Rectangle.Rectangle2D(area.x + x, area.y + y, 1, 1))
+        return region
+
+    def _compose(self, area: PyxelWidgets.Utils.Rectangle.Rectangle2D):
+        """ Rebuild area from every widget covering it, bottom to top and mark it damaged """
+        self.damage.add(area)
+        widgets = set()
+        for column in self._cells[area.l:area.r]:
+            for cell in column[area.b:area.t]:
+                widgets.update(cell)
+        self.buffer[area.slice].fill(PyxelWidgets.Utils.Pixel.Colors.Invisible)
+        for widget in sorted(widgets, key = self._order.get):
+            overlap = widget.rect.intersect(area)
+            self.buffer.composite(widget.buffer[(overlap - widget.rect).slice], overlap.x, overlap.y, widget.blend)
+
 class Manager():
 
     _count = 0
@@ -78,9 +238,10 @@ class Manager():
         self.windows = {}
         self.controllers = {}
         self.rect = PyxelWidgets.Utils.Rectangle.Rectangle2D(0, 0, width, height)
-        self.buffer = numpy.ndarray((self.rect.w, self.rect.h), PyxelWidgets.Utils.Pixel.Pixel)
-        self.buffer.fill(PyxelWidgets.Utils.Pixel.Colors.Invisible)
+        self.buffer = PyxelWidgets.Utils.Pixel.PixelBuffer(self.rect.w, self.rect.h, PyxelWidgets.Utils.Pixel.Colors.Invisible)
         self.callback = kwargs.get('callback', lambda *_, **__: None)
+        self._routes = {}
+        self.damage = PyxelWidgets.Utils.Rectangle.Region([self.rect])
         Manager._count += 1
     
     def destroy(self):
@@ -89,52 +250,122 @@ class Manager():
             self.removeController(controller)
 
     def addWindow(self, window: Window, x: int, y: int, width: int, height: int) -> None:
+        if window.name in self.windows:
+            self.damage.add(self.rect.intersect(self.windows[window.name]['rect']))
         self.windows[window.name] = {}
         self.windows[window.name]['window'] = window
         self.windows[window.name]['rect'] = PyxelWidgets.Utils.Rectangle.Rectangle2D(x, y, width, height)
+        self.damage.add(self.rect.intersect(self.windows[window.name]['rect']))
+        self.reroute()
     
     def removeWindow(self, name: str):
         if name in self.windows:
-            self.windows.pop(name)
+            self.damage.add(self.rect.intersect(self.windows.pop(name)['rect']))
+            self.reroute()
 
     def addController(self, controller: PyxelWidgets.Controllers.Controller, x: int, y: int):
         self.controllers[controller.name] = {}
         self.controllers[controller.name]['controller'] = controller
         self.controllers[controller.name]['rect'] = PyxelWidgets.Utils.Rectangle.Rectangle2D(x, y, controller.rect.w, controller.rect.h)
         controller.setCallback(self.process)
+        self.damage.add(self.rect.intersect(self.controllers[controller.name]['rect']))
+        self.reroute()
     
     def removeController(self, name):
         if name in self.controllers:
             self.controllers.pop(name)
+            self.reroute()
+
+    def reroute(self):
+        """ Rebuild controller cell to window cell map used for input routing """
+        self._routes = {}
+        for name, controller in self.controllers.items():
+            cr = controller['rect']
+            routes = [[[] for y in range(cr.h)] for x in range(cr.w)]
+            for window in self.windows.values():
+                wr = window['rect']
+                overlap = cr.intersect(wr)
+                if overlap is not None:
+                    for x in overlap.columns:
+                        for y in overlap.rows:
+                            routes[x - cr.x][y - cr.y].append((window['window'], x - wr.x, y - wr.y))
+            self._routes[name] = [[tuple(cell) for cell in column] for column in routes]
     
     def forceUpdate(self):
+        self.damage.add(self.rect)
         for window in list(self.windows.values()):
-            window.forceUpdate()
+            window['window'].forceUpdate()
 
     def process(self, name, event, data):
         if event != PyxelWidgets.Utils.Enums.Event.Custom:
-            for window in list(self.windows.values()):
-                cr = self.controllers[name]['rect']
-                wr = window['rect']
-                if cr.collide(wr):
-                    cwr = cr - wr
-                    window['window'].process(name, event, (data[0] + cwr.x, data[1] + cwr.y, data[2]))
+            x, y, value = data
+            routes = self._routes.get(name)
+            if routes is not None and 0 <= x < len(routes) and 0 <= y < len(routes[x]):
+                for window, wx, wy in routes[x][y]:
+                    window.process(name, event, (wx, wy, value))
         else:
             self.callback(name, event, data)
 
     def setCallback(self, callback) -> None:
         self.callback = callback
 
+    def setValues(self, values, notify: bool = True, coalesce: bool = None) -> None:
+        """
+        Description
+        ----
+        Set values of widgets in many windows at once, see Window.setValues.
+        key is a widget name, first window having it is used,
+        or (window name, widget name or index) tuple, a channel of a
+        bank widget is addressed by (widget name, channel) or
+        (window name, widget name or index, channel) tuple.
+        """
+        items = values.items() if isinstance(values, dict) else values
+        windows = {}
+        for key, value in items:
+            window = None
+            if isinstance(key, tuple) and key[0] in self.windows:
+                window = self.windows[key[0]]['window']
+                key = key[1] if len(key) == 2 else key[1:]
+            else:
+                name = key[0] if isinstance(key, tuple) else key
+                for entry in self.windows.values():
+                    if name in entry['window'].widgets:
+                        window = entry['window']
+                        break
+            if window is not None:
+                windows.setdefault(window, []).append((key, value))
+        for window, pairs in windows.items():
+            window.setValues(pairs, notify, coalesce)
+
     def update(self):
+        damage, self.damage = self.damage, PyxelWidgets.Utils.Rectangle.Region()
         for window in list(self.windows.values()):
             intersect = self.rect.intersect(window['rect'])
             if intersect:
-                rect, buffer = window['window'].updateArea(intersect.origin)
-                if rect is not None:
-                    update = rect + intersect
-                    self.buffer[update.slice] = buffer[rect.slice]
-        self.buffer = numpy.where(self.buffer == PyxelWidgets.Utils.Pixel.Colors.Invisible, PyxelWidgets.Utils.Pixel.Colors.Black, self.buffer)
+                window['window'].updateArea(intersect.origin)
+                for rect in window['window'].damage.clip(intersect.origin):
+                    damage.add(rect + intersect)
+                window['window'].damage.clear()
+        for rect in damage:
+            self._compose(rect)
         for controller in list(self.controllers.values()):
             intersect = self.rect.intersect(controller['rect'])
             if intersect:
-                controller['controller'].update((intersect.origin, self.buffer[intersect.slice]))
\ No newline at end of file
+                for rect in damage.clip(intersect):
+                    controller['controller'].update((rect - intersect, self.buffer[rect.slice]))
+
+    def _compose(self, area: PyxelWidgets.Utils.Rectangle.Rectangle2D):
+        """ Rebuild area from every window covering it, bottom to top """
+        self.buffer[area.slice].fill(PyxelWidgets.Utils.Pixel.Colors.Invisible)
+        for window in list(self.windows.values()):
+            intersect = self.rect.intersect(window['rect'])
+            if intersect:
+                # only the part of the window shown by the manager is composed
+                clipped = area.intersect(intersect)
+                if clipped is not None:
+                    overlap = window['window'].rect.intersect(clipped - intersect)
+                    if overlap is not None:
+                        update = overlap + intersect
+                        self.buffer.composite(window['window'].buffer[overlap.slice], update.x, update.y, window['window'].blend)
+        view = self.buffer[area.slice]
+        self.buffer[area.slice] = PyxelWidgets.Utils.Pixel.PixelBuffer.where(view == PyxelWidgets.Utils.Pixel.Colors.Invisible, PyxelWidgets.Utils.Pixel.Colors.Black, view)
@@ -0,0 +1,28 @@
+import itertools
+import PyxelWidgets.Utils.Rectangle
+import PyxelWidgets.Widgets
+import pytest
+
+SIZES = range(1, 7)
+
+def render(widget):
+    widget.value = 0.37
+    _, buffer = widget.updateArea(PyxelWidgets.Utils.Rectangle.Rectangle2D(0, 0, 8, 8))[:2]
+    return buffer.data.copy()
+
+@pytest.mark.parametrize('widgetClass, kwargs', [
+    (PyxelWidgets.Widgets.Fader, {}),
+    (PyxelWidgets.Widgets.Fader, {'grid': PyxelWidgets.Widgets.Fader.Grid.Matrix}),
+    (PyxelWidgets.Widgets.Knob, {}),
+    (PyxelWidgets.Widgets.FaderBank, {'channels': 4}),
+    (PyxelWidgets.Widgets.KnobBank, {'knobWidth': 2, 'channels': 4}),
+    (PyxelWidgets.Widgets.KnobBank, {'knobWidth': 3, 'knobHeight': 2, 'channels': 3}),
+])
+def test_resize_matches_new_widget(widgetClass, kwargs):
+    """ Resized widget renders the same as a widget created with the new size """
+    for width, height, newWidth, newHeight in itertools.product(SIZES, repeat = 4):
+        widget = widgetClass(0, 0, width, height, **kwargs)
+        widget.width = newWidth
+        widget.height = newHeight
+        fresh = widgetClass(0, 0, newWidth, newHeight, **kwargs)
+        assert (render(widget) == render(fresh)).all(), (width, height, newWidth, newHeight)